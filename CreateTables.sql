@@ -195,7 +195,536 @@ CREATE INDEX IDX_Clubs_Name ON Clubs (Name);
 
 CREATE INDEX IDX_Player_Name ON Player (Name);
 
+/* [NOUVEAU] Index de pagination par clé (keyset) des listes joueurs et matchs */
+CREATE INDEX IDX_Player_Name_Id ON Player (Name, ID_Pla);
+
+CREATE INDEX IDX_Game_Date_Id ON Game (Game_date DESC, ID_Gam DESC);
+
+/* [NOUVEAU] Recherche par sous-chaîne sur le nom des joueurs : un B-tree ne sert pas */
+/* pour ILIKE '%q%', l'index trigramme (pg_trgm) si, et fournit le score de similarité. */
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IDX_Player_Name_Trgm ON Player USING GIN (Name gin_trgm_ops);
+
 /* [NOUVEAU] Index pour les filtres de match fréquents */
 CREATE INDEX IDX_Game_Type ON Game (Game_type);
 
-CREATE INDEX IDX_Game_Season ON Game (Season);
\ No newline at end of file
+CREATE INDEX IDX_Game_Season ON Game (Season);
+
+/* [NOUVEAU] Chargement incrémental du moteur analytique (columnar.py) : */
+/* seules les lignes au-delà du dernier ID_Stat chargé sont relues. */
+CREATE INDEX IDX_PGS_Stat ON PLAYER_GAME_STATS (ID_Stat);
+
+---
+/* [NOUVEAU] Statistiques de carrière agrégées par joueur */
+/* Maintenue par trigger à chaque INSERT / UPDATE / DELETE sur PLAYER_GAME_STATS, */
+/* la page profil lit une seule ligne au lieu de parcourir tout l'historique. */
+
+CREATE TABLE Player_Career_Stats (
+    ID_Pla INT PRIMARY KEY,
+    Games_played INT NOT NULL DEFAULT 0,
+    Points INT NOT NULL DEFAULT 0,
+    Rebounds INT NOT NULL DEFAULT 0,
+    Assists INT NOT NULL DEFAULT 0,
+    Blocks INT NOT NULL DEFAULT 0,
+    Points_2pts_made INT NOT NULL DEFAULT 0,
+    Points_2pts_attempted INT NOT NULL DEFAULT 0,
+    Points_3pts_made INT NOT NULL DEFAULT 0,
+    Points_3pts_attempted INT NOT NULL DEFAULT 0,
+    Free_throws_made INT NOT NULL DEFAULT 0,
+    Free_throws_attempted INT NOT NULL DEFAULT 0,
+    CONSTRAINT FK_PCS_Player FOREIGN KEY (ID_Pla) REFERENCES Player (ID_Pla)
+);
+
+CREATE OR REPLACE FUNCTION Player_Career_Stats_Apply() RETURNS TRIGGER AS $$
+BEGIN
+    /* Retire l'ancienne ligne (UPDATE / DELETE) */
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE Player_Career_Stats SET
+            Games_played = Games_played - 1,
+            Points = Points - (
+                2 * COALESCE(OLD.Points_2pts_made, 0)
+                + 3 * COALESCE(OLD.Points_3pts_made, 0)
+                + COALESCE(OLD.Free_throws_made, 0)
+            ),
+            Rebounds = Rebounds - COALESCE(OLD.Rebounds, 0),
+            Assists = Assists - COALESCE(OLD.Assists, 0),
+            Blocks = Blocks - COALESCE(OLD.Blocks, 0),
+            Points_2pts_made = Points_2pts_made - COALESCE(OLD.Points_2pts_made, 0),
+            Points_2pts_attempted = Points_2pts_attempted - COALESCE(OLD.Points_2pts_attempted, 0),
+            Points_3pts_made = Points_3pts_made - COALESCE(OLD.Points_3pts_made, 0),
+            Points_3pts_attempted = Points_3pts_attempted - COALESCE(OLD.Points_3pts_attempted, 0),
+            Free_throws_made = Free_throws_made - COALESCE(OLD.Free_throws_made, 0),
+            Free_throws_attempted = Free_throws_attempted - COALESCE(OLD.Free_throws_attempted, 0)
+        WHERE ID_Pla = OLD.ID_Pla;
+
+        DELETE FROM Player_Career_Stats
+        WHERE ID_Pla = OLD.ID_Pla AND Games_played <= 0;
+    END IF;
+
+    /* Ajoute la nouvelle ligne (INSERT / UPDATE) */
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO Player_Career_Stats (
+            ID_Pla, Games_played, Points, Rebounds, Assists, Blocks,
+            Points_2pts_made, Points_2pts_attempted,
+            Points_3pts_made, Points_3pts_attempted,
+            Free_throws_made, Free_throws_attempted
+        ) VALUES (
+            NEW.ID_Pla,
+            1,
+            2 * COALESCE(NEW.Points_2pts_made, 0)
+            + 3 * COALESCE(NEW.Points_3pts_made, 0)
+            + COALESCE(NEW.Free_throws_made, 0),
+            COALESCE(NEW.Rebounds, 0),
+            COALESCE(NEW.Assists, 0),
+            COALESCE(NEW.Blocks, 0),
+            COALESCE(NEW.Points_2pts_made, 0),
+            COALESCE(NEW.Points_2pts_attempted, 0),
+            COALESCE(NEW.Points_3pts_made, 0),
+            COALESCE(NEW.Points_3pts_attempted, 0),
+            COALESCE(NEW.Free_throws_made, 0),
+            COALESCE(NEW.Free_throws_attempted, 0)
+        )
+        ON CONFLICT (ID_Pla) DO UPDATE SET
+            Games_played = Player_Career_Stats.Games_played + EXCLUDED.Games_played,
+            Points = Player_Career_Stats.Points + EXCLUDED.Points,
+            Rebounds = Player_Career_Stats.Rebounds + EXCLUDED.Rebounds,
+            Assists = Player_Career_Stats.Assists + EXCLUDED.Assists,
+            Blocks = Player_Career_Stats.Blocks + EXCLUDED.Blocks,
+            Points_2pts_made = Player_Career_Stats.Points_2pts_made + EXCLUDED.Points_2pts_made,
+            Points_2pts_attempted = Player_Career_Stats.Points_2pts_attempted + EXCLUDED.Points_2pts_attempted,
+            Points_3pts_made = Player_Career_Stats.Points_3pts_made + EXCLUDED.Points_3pts_made,
+            Points_3pts_attempted = Player_Career_Stats.Points_3pts_attempted + EXCLUDED.Points_3pts_attempted,
+            Free_throws_made = Player_Career_Stats.Free_throws_made + EXCLUDED.Free_throws_made,
+            Free_throws_attempted = Player_Career_Stats.Free_throws_attempted + EXCLUDED.Free_throws_attempted;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER TRG_PGS_Career_Stats
+AFTER INSERT OR UPDATE OR DELETE ON PLAYER_GAME_STATS
+FOR EACH ROW EXECUTE FUNCTION Player_Career_Stats_Apply();
+
+/* Reconstruction complète (flask rebuild-career-stats, ou après un chargement massif) */
+CREATE OR REPLACE FUNCTION Rebuild_Player_Career_Stats() RETURNS VOID AS $$
+BEGIN
+    LOCK TABLE PLAYER_GAME_STATS IN SHARE MODE;
+    DELETE FROM Player_Career_Stats;
+    INSERT INTO Player_Career_Stats (
+        ID_Pla, Games_played, Points, Rebounds, Assists, Blocks,
+        Points_2pts_made, Points_2pts_attempted,
+        Points_3pts_made, Points_3pts_attempted,
+        Free_throws_made, Free_throws_attempted
+    )
+    SELECT
+        ID_Pla,
+        COUNT(*),
+        SUM(
+            2 * COALESCE(Points_2pts_made, 0)
+            + 3 * COALESCE(Points_3pts_made, 0)
+            + COALESCE(Free_throws_made, 0)
+        ),
+        SUM(COALESCE(Rebounds, 0)),
+        SUM(COALESCE(Assists, 0)),
+        SUM(COALESCE(Blocks, 0)),
+        SUM(COALESCE(Points_2pts_made, 0)),
+        SUM(COALESCE(Points_2pts_attempted, 0)),
+        SUM(COALESCE(Points_3pts_made, 0)),
+        SUM(COALESCE(Points_3pts_attempted, 0)),
+        SUM(COALESCE(Free_throws_made, 0)),
+        SUM(COALESCE(Free_throws_attempted, 0))
+    FROM PLAYER_GAME_STATS
+    GROUP BY ID_Pla;
+    PERFORM Bump_Table_Version('player_game_stats');
+END;
+$$ LANGUAGE plpgsql;
+
+---
+/* [NOUVEAU] Classements pré-calculés (points, rebonds, passes, contres, tirs à 3 pts) */
+/* Totaux par joueur et par périmètre : 'overall' (clé ''), 'season' (saison), */
+/* 'league' (ID_Lea), 'championship' (ID_Cha) et 'national' (tous les matchs de */
+/* championnat, clé ''). Maintenus par trigger à chaque ligne de statistiques : un */
+/* top N est une lecture d'index (IDX_LT_*) au lieu d'une agrégation complète. */
+
+CREATE TABLE Leaderboard_Totals (
+    Scope VARCHAR(12) NOT NULL,
+    Scope_key VARCHAR(50) NOT NULL,
+    ID_Pla INT NOT NULL,
+    Games_played INT NOT NULL DEFAULT 0,
+    Points INT NOT NULL DEFAULT 0,
+    Rebounds INT NOT NULL DEFAULT 0,
+    Assists INT NOT NULL DEFAULT 0,
+    Blocks INT NOT NULL DEFAULT 0,
+    Points_3pts_made INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (Scope, Scope_key, ID_Pla),
+    CONSTRAINT FK_LT_Player FOREIGN KEY (ID_Pla) REFERENCES Player (ID_Pla),
+    CONSTRAINT CK_LT_Scope CHECK (Scope IN ('overall', 'season', 'league', 'championship', 'national'))
+);
+
+CREATE INDEX IDX_LT_Points ON Leaderboard_Totals (Scope, Scope_key, Points DESC, ID_Pla);
+
+CREATE INDEX IDX_LT_Rebounds ON Leaderboard_Totals (Scope, Scope_key, Rebounds DESC, ID_Pla);
+
+CREATE INDEX IDX_LT_Assists ON Leaderboard_Totals (Scope, Scope_key, Assists DESC, ID_Pla);
+
+CREATE INDEX IDX_LT_Blocks ON Leaderboard_Totals (Scope, Scope_key, Blocks DESC, ID_Pla);
+
+CREATE INDEX IDX_LT_Points_3pts ON Leaderboard_Totals (Scope, Scope_key, Points_3pts_made DESC, ID_Pla);
+
+/* Périmètres auxquels contribue chaque match */
+CREATE VIEW Game_Leaderboard_Scope AS
+SELECT ID_Gam, 'overall' AS Scope, '' AS Scope_key FROM Game
+UNION ALL
+SELECT ID_Gam, 'season', Season FROM Game WHERE Season IS NOT NULL
+UNION ALL
+SELECT ID_Gam, 'league', CAST(ID_Lea AS TEXT) FROM Game WHERE ID_Lea IS NOT NULL
+UNION ALL
+SELECT ID_Gam, 'championship', CAST(ID_Cha AS TEXT) FROM Game WHERE ID_Cha IS NOT NULL
+UNION ALL
+SELECT ID_Gam, 'national', '' FROM Game WHERE ID_Cha IS NOT NULL;
+
+CREATE OR REPLACE FUNCTION Leaderboard_Totals_Apply() RETURNS TRIGGER AS $$
+BEGIN
+    /* Retire l'ancienne ligne (UPDATE / DELETE) de chaque périmètre du match */
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE Leaderboard_Totals SET
+            Games_played = Games_played - 1,
+            Points = Points - (
+                2 * COALESCE(OLD.Points_2pts_made, 0)
+                + 3 * COALESCE(OLD.Points_3pts_made, 0)
+                + COALESCE(OLD.Free_throws_made, 0)
+            ),
+            Rebounds = Rebounds - COALESCE(OLD.Rebounds, 0),
+            Assists = Assists - COALESCE(OLD.Assists, 0),
+            Blocks = Blocks - COALESCE(OLD.Blocks, 0),
+            Points_3pts_made = Points_3pts_made - COALESCE(OLD.Points_3pts_made, 0)
+        WHERE ID_Pla = OLD.ID_Pla
+          AND (Scope, Scope_key) IN (
+              SELECT Scope, Scope_key FROM Game_Leaderboard_Scope WHERE ID_Gam = OLD.ID_Gam
+          );
+
+        DELETE FROM Leaderboard_Totals
+        WHERE ID_Pla = OLD.ID_Pla AND Games_played <= 0;
+    END IF;
+
+    /* Ajoute la nouvelle ligne (INSERT / UPDATE) */
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO Leaderboard_Totals (
+            Scope, Scope_key, ID_Pla, Games_played,
+            Points, Rebounds, Assists, Blocks, Points_3pts_made
+        )
+        SELECT
+            s.Scope, s.Scope_key, NEW.ID_Pla, 1,
+            2 * COALESCE(NEW.Points_2pts_made, 0)
+            + 3 * COALESCE(NEW.Points_3pts_made, 0)
+            + COALESCE(NEW.Free_throws_made, 0),
+            COALESCE(NEW.Rebounds, 0),
+            COALESCE(NEW.Assists, 0),
+            COALESCE(NEW.Blocks, 0),
+            COALESCE(NEW.Points_3pts_made, 0)
+        FROM Game_Leaderboard_Scope s
+        WHERE s.ID_Gam = NEW.ID_Gam
+        ON CONFLICT (Scope, Scope_key, ID_Pla) DO UPDATE SET
+            Games_played = Leaderboard_Totals.Games_played + EXCLUDED.Games_played,
+            Points = Leaderboard_Totals.Points + EXCLUDED.Points,
+            Rebounds = Leaderboard_Totals.Rebounds + EXCLUDED.Rebounds,
+            Assists = Leaderboard_Totals.Assists + EXCLUDED.Assists,
+            Blocks = Leaderboard_Totals.Blocks + EXCLUDED.Blocks,
+            Points_3pts_made = Leaderboard_Totals.Points_3pts_made + EXCLUDED.Points_3pts_made;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER TRG_PGS_Leaderboard_Totals
+AFTER INSERT OR UPDATE OR DELETE ON PLAYER_GAME_STATS
+FOR EACH ROW EXECUTE FUNCTION Leaderboard_Totals_Apply();
+
+/* Un match qui change de saison, de ligue ou de championnat déplace ses lignes */
+CREATE OR REPLACE FUNCTION Leaderboard_Totals_Move_Game() RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE Leaderboard_Totals t SET
+        Games_played = t.Games_played - 1,
+        Points = t.Points - (
+            2 * COALESCE(pgs.Points_2pts_made, 0)
+            + 3 * COALESCE(pgs.Points_3pts_made, 0)
+            + COALESCE(pgs.Free_throws_made, 0)
+        ),
+        Rebounds = t.Rebounds - COALESCE(pgs.Rebounds, 0),
+        Assists = t.Assists - COALESCE(pgs.Assists, 0),
+        Blocks = t.Blocks - COALESCE(pgs.Blocks, 0),
+        Points_3pts_made = t.Points_3pts_made - COALESCE(pgs.Points_3pts_made, 0)
+    FROM PLAYER_GAME_STATS pgs, (
+        SELECT 'season' AS Scope, OLD.Season AS Scope_key
+        UNION ALL SELECT 'league', CAST(OLD.ID_Lea AS TEXT)
+        UNION ALL SELECT 'championship', CAST(OLD.ID_Cha AS TEXT)
+        UNION ALL SELECT 'national', CASE WHEN OLD.ID_Cha IS NOT NULL THEN '' END
+    ) s
+    WHERE pgs.ID_Gam = OLD.ID_Gam
+      AND t.ID_Pla = pgs.ID_Pla
+      AND t.Scope = s.Scope
+      AND t.Scope_key = s.Scope_key;
+
+    DELETE FROM Leaderboard_Totals
+    WHERE Games_played <= 0
+      AND ID_Pla IN (SELECT ID_Pla FROM PLAYER_GAME_STATS WHERE ID_Gam = OLD.ID_Gam);
+
+    INSERT INTO Leaderboard_Totals (
+        Scope, Scope_key, ID_Pla, Games_played,
+        Points, Rebounds, Assists, Blocks, Points_3pts_made
+    )
+    SELECT
+        s.Scope, s.Scope_key, pgs.ID_Pla, 1,
+        2 * COALESCE(pgs.Points_2pts_made, 0)
+        + 3 * COALESCE(pgs.Points_3pts_made, 0)
+        + COALESCE(pgs.Free_throws_made, 0),
+        COALESCE(pgs.Rebounds, 0),
+        COALESCE(pgs.Assists, 0),
+        COALESCE(pgs.Blocks, 0),
+        COALESCE(pgs.Points_3pts_made, 0)
+    FROM PLAYER_GAME_STATS pgs
+    JOIN Game_Leaderboard_Scope s ON s.ID_Gam = pgs.ID_Gam
+    WHERE pgs.ID_Gam = NEW.ID_Gam AND s.Scope <> 'overall'
+    ON CONFLICT (Scope, Scope_key, ID_Pla) DO UPDATE SET
+        Games_played = Leaderboard_Totals.Games_played + EXCLUDED.Games_played,
+        Points = Leaderboard_Totals.Points + EXCLUDED.Points,
+        Rebounds = Leaderboard_Totals.Rebounds + EXCLUDED.Rebounds,
+        Assists = Leaderboard_Totals.Assists + EXCLUDED.Assists,
+        Blocks = Leaderboard_Totals.Blocks + EXCLUDED.Blocks,
+        Points_3pts_made = Leaderboard_Totals.Points_3pts_made + EXCLUDED.Points_3pts_made;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER TRG_Game_Leaderboard_Totals
+AFTER UPDATE OF Season, ID_Lea, ID_Cha ON Game
+FOR EACH ROW
+WHEN (OLD.Season IS DISTINCT FROM NEW.Season
+      OR OLD.ID_Lea IS DISTINCT FROM NEW.ID_Lea
+      OR OLD.ID_Cha IS DISTINCT FROM NEW.ID_Cha)
+EXECUTE FUNCTION Leaderboard_Totals_Move_Game();
+
+/* Reconstruction complète (flask rebuild-leaderboards, ou après un chargement massif) */
+CREATE OR REPLACE FUNCTION Rebuild_Leaderboard_Totals() RETURNS VOID AS $$
+BEGIN
+    LOCK TABLE PLAYER_GAME_STATS IN SHARE MODE;
+    DELETE FROM Leaderboard_Totals;
+    INSERT INTO Leaderboard_Totals (
+        Scope, Scope_key, ID_Pla, Games_played,
+        Points, Rebounds, Assists, Blocks, Points_3pts_made
+    )
+    SELECT
+        s.Scope, s.Scope_key, pgs.ID_Pla, COUNT(*),
+        SUM(
+            2 * COALESCE(pgs.Points_2pts_made, 0)
+            + 3 * COALESCE(pgs.Points_3pts_made, 0)
+            + COALESCE(pgs.Free_throws_made, 0)
+        ),
+        SUM(COALESCE(pgs.Rebounds, 0)),
+        SUM(COALESCE(pgs.Assists, 0)),
+        SUM(COALESCE(pgs.Blocks, 0)),
+        SUM(COALESCE(pgs.Points_3pts_made, 0))
+    FROM PLAYER_GAME_STATS pgs
+    JOIN Game_Leaderboard_Scope s ON s.ID_Gam = pgs.ID_Gam
+    GROUP BY s.Scope, s.Scope_key, pgs.ID_Pla;
+    PERFORM Bump_Table_Version('player_game_stats');
+END;
+$$ LANGUAGE plpgsql;
+
+---
+/* [NOUVEAU] Version des données par table, pour le cache de résultats de l'exécuteur SQL */
+/* Incrémentée par un trigger par instruction (pas par ligne) sur chaque table : un résultat */
+/* mis en cache reste valide tant que les versions des tables qu'il lit n'ont pas bougé. */
+/* Player_Career_Stats et Leaderboard_Totals n'ont pas de version propre : écrites par les */
+/* triggers par ligne de PLAYER_GAME_STATS, elles multiplieraient les mises à jour de */
+/* quelques lignes très disputées. L'application leur applique la version de */
+/* PLAYER_GAME_STATS (et de Game pour Leaderboard_Totals), que leurs fonctions de */
+/* reconstruction incrémentent. */
+
+CREATE TABLE Data_Version (
+    Table_name VARCHAR(63) PRIMARY KEY,
+    Version BIGINT NOT NULL DEFAULT 0,
+    Changed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION Bump_Table_Version(p_table TEXT) RETURNS VOID AS $$
+BEGIN
+    INSERT INTO Data_Version (Table_name, Version, Changed_at)
+    VALUES (lower(p_table), 1, now())
+    ON CONFLICT (Table_name) DO UPDATE SET
+        Version = Data_Version.Version + 1,
+        Changed_at = EXCLUDED.Changed_at;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION Data_Version_Bump() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM Bump_Table_Version(TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    v_table TEXT;
+BEGIN
+    FOREACH v_table IN ARRAY ARRAY[
+        'league', 'championship', 'clubs', 'sponsor', 'national_team', 'player',
+        'game', 'game_participant', 'player_game_stats', 'has_sponsor_club',
+        'has_sponsor_team', 'member_of', 'participates_in', 'participates_in_league'
+    ] LOOP
+        INSERT INTO Data_Version (Table_name) VALUES (v_table) ON CONFLICT DO NOTHING;
+        EXECUTE format(
+            'CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %I '
+            'FOR EACH STATEMENT EXECUTE FUNCTION Data_Version_Bump()',
+            'trg_' || v_table || '_data_version', v_table
+        );
+    END LOOP;
+END;
+$$;
+
+---
+/* [NOUVEAU] Vues matérialisées (classements et vues d'exercice pré-agrégés) */
+/* Créées vides, remplies par Refresh_Materialized_View() : flask refresh-matviews, */
+/* bouton de l'administration ou fin de seed_db.py. L'index unique de chaque vue */
+/* permet REFRESH ... CONCURRENTLY (les lectures ne sont pas bloquées). */
+
+CREATE MATERIALIZED VIEW MV_Top_National_Team_Scorers AS
+SELECT p.ID_Pla, p.Player_ID, p.Name, SUM(
+        2 * pgs.Points_2pts_made + 3 * pgs.Points_3pts_made + pgs.Free_throws_made
+    ) AS Total_points
+FROM
+    Player p
+    JOIN PLAYER_GAME_STATS pgs ON p.ID_Pla = pgs.ID_Pla
+    JOIN Game g ON g.ID_Gam = pgs.ID_Gam
+WHERE
+    g.Game_type IN ('Group Stage', 'Final')
+GROUP BY
+    p.ID_Pla,
+    p.Player_ID,
+    p.Name
+WITH NO DATA;
+
+CREATE UNIQUE INDEX IDX_MV_Top_Scorers_Pla ON MV_Top_National_Team_Scorers (ID_Pla);
+
+CREATE MATERIALIZED VIEW MV_Club_Average_Height AS
+SELECT c.ID_Clu, c.Club_ID, c.Name AS Club_name, AVG(p.Height) AS Avg_height
+FROM Clubs c
+    JOIN Player p ON p.Current_club_ID = c.ID_Clu
+GROUP BY
+    c.ID_Clu,
+    c.Club_ID,
+    c.Name
+WITH NO DATA;
+
+CREATE UNIQUE INDEX IDX_MV_Club_Height_Clu ON MV_Club_Average_Height (ID_Clu);
+
+CREATE MATERIALIZED VIEW MV_Sponsors_Of_National_Teams AS
+SELECT hst.ID_Spo, hst.ID_Nat, s.Company_name, s.City, t.Country
+FROM
+    Has_Sponsor_Team hst
+    JOIN Sponsor s ON s.ID_Spo = hst.ID_Spo
+    JOIN National_team t ON t.ID_Nat = hst.ID_Nat
+WITH NO DATA;
+
+CREATE UNIQUE INDEX IDX_MV_Team_Sponsors_Key ON MV_Sponsors_Of_National_Teams (ID_Spo, ID_Nat);
+
+/* Classement des joueurs par saison (points, rebonds, passes, contres) */
+CREATE MATERIALIZED VIEW MV_Season_Player_Leaderboard AS
+SELECT
+    COALESCE(g.Season, 'N/A') AS Season,
+    p.ID_Pla,
+    p.Name,
+    COUNT(*) AS Games_played,
+    SUM(
+        2 * COALESCE(pgs.Points_2pts_made, 0)
+        + 3 * COALESCE(pgs.Points_3pts_made, 0)
+        + COALESCE(pgs.Free_throws_made, 0)
+    ) AS Points,
+    SUM(COALESCE(pgs.Rebounds, 0)) AS Rebounds,
+    SUM(COALESCE(pgs.Assists, 0)) AS Assists,
+    SUM(COALESCE(pgs.Blocks, 0)) AS Blocks
+FROM
+    PLAYER_GAME_STATS pgs
+    JOIN Player p ON p.ID_Pla = pgs.ID_Pla
+    JOIN Game g ON g.ID_Gam = pgs.ID_Gam
+GROUP BY
+    COALESCE(g.Season, 'N/A'),
+    p.ID_Pla,
+    p.Name
+WITH NO DATA;
+
+CREATE UNIQUE INDEX IDX_MV_Season_Leaderboard_Key ON MV_Season_Player_Leaderboard (Season, ID_Pla);
+
+CREATE INDEX IDX_MV_Season_Leaderboard_Points ON MV_Season_Player_Leaderboard (Season, Points DESC);
+
+/* Classement des clubs par saison (victoires, défaites, points marqués / encaissés) */
+CREATE MATERIALIZED VIEW MV_Season_Club_Standings AS
+SELECT
+    COALESCE(g.Season, 'N/A') AS Season,
+    c.ID_Clu,
+    c.Name AS Club_name,
+    COUNT(*) AS Games_played,
+    COUNT(*) FILTER (WHERE gp.Score > opp.Score) AS Wins,
+    COUNT(*) FILTER (WHERE gp.Score < opp.Score) AS Losses,
+    SUM(gp.Score) AS Points_for,
+    SUM(opp.Score) AS Points_against
+FROM
+    Game_Participant gp
+    JOIN Game_Participant opp ON opp.ID_Gam = gp.ID_Gam
+    AND (opp.Participant_ID, opp.Participant_Type) <> (gp.Participant_ID, gp.Participant_Type)
+    JOIN Game g ON g.ID_Gam = gp.ID_Gam
+    JOIN Clubs c ON c.ID_Clu = gp.Participant_ID
+WHERE
+    gp.Participant_Type = 'Club'
+GROUP BY
+    COALESCE(g.Season, 'N/A'),
+    c.ID_Clu,
+    c.Name
+WITH NO DATA;
+
+CREATE UNIQUE INDEX IDX_MV_Club_Standings_Key ON MV_Season_Club_Standings (Season, ID_Clu);
+
+/* Dernier rafraîchissement de chaque vue matérialisée */
+CREATE TABLE Matview_Refresh_Log (
+    View_name VARCHAR(63) PRIMARY KEY,
+    Last_refresh TIMESTAMPTZ NOT NULL,
+    Duration_ms NUMERIC(12, 1) NOT NULL,
+    Concurrent BOOLEAN NOT NULL
+);
+
+/* Rafraîchit une vue matérialisée et journalise l'horodatage et la durée. */
+/* CONCURRENTLY exige une vue déjà remplie : le tout premier rafraîchissement est complet. */
+CREATE OR REPLACE FUNCTION Refresh_Materialized_View(p_view TEXT) RETURNS NUMERIC AS $$
+DECLARE
+    v_name TEXT := lower(p_view);
+    v_populated BOOLEAN;
+    v_started TIMESTAMPTZ := clock_timestamp();
+    v_duration NUMERIC;
+BEGIN
+    SELECT ispopulated INTO v_populated FROM pg_matviews WHERE matviewname = v_name;
+    IF v_populated IS NULL THEN
+        RAISE EXCEPTION 'Vue matérialisée inconnue : %', p_view;
+    END IF;
+
+    IF v_populated THEN
+        EXECUTE format('REFRESH MATERIALIZED VIEW CONCURRENTLY %I', v_name);
+    ELSE
+        EXECUTE format('REFRESH MATERIALIZED VIEW %I', v_name);
+    END IF;
+
+    v_duration := round((extract(epoch FROM clock_timestamp() - v_started) * 1000)::NUMERIC, 1);
+    INSERT INTO Matview_Refresh_Log (View_name, Last_refresh, Duration_ms, Concurrent)
+    VALUES (v_name, clock_timestamp(), v_duration, v_populated)
+    ON CONFLICT (View_name) DO UPDATE SET
+        Last_refresh = EXCLUDED.Last_refresh,
+        Duration_ms = EXCLUDED.Duration_ms,
+        Concurrent = EXCLUDED.Concurrent;
+    PERFORM Bump_Table_Version(v_name);
+    RETURN v_duration;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,621 @@
+/* Schéma SQLite équivalent à CreateTables.sql (base de test ou de développement, */
+/* fichier ou :memory:), chargé par "flask --app app init-db" quand DATABASE_URL est */
+/* une URL sqlite://. Différences : INTEGER PRIMARY KEY au lieu de SERIAL, triggers */
+/* ligne à ligne au lieu de fonctions plpgsql, vues simples au lieu de vues */
+/* matérialisées, pas d'index trigramme. */
+
+/* Tables structurelles (ligues, championnats, entités) */
+
+CREATE TABLE League (
+    ID_Lea INTEGER PRIMARY KEY,
+    League_ID VARCHAR(10) NOT NULL,
+    Name VARCHAR(100) NOT NULL,
+    Country VARCHAR(100) NOT NULL,
+    Level VARCHAR(50) NOT NULL
+);
+
+CREATE TABLE Championship (
+    ID_Cha INTEGER PRIMARY KEY,
+    Championship_ID VARCHAR(10) NOT NULL,
+    Name VARCHAR(100) NOT NULL,
+    Year INT NOT NULL,
+    Type VARCHAR(50) NOT NULL
+);
+
+CREATE TABLE Clubs (
+    ID_Clu INTEGER PRIMARY KEY,
+    Club_ID VARCHAR(10) NOT NULL,
+    Name VARCHAR(100) NOT NULL,
+    City VARCHAR(100) NOT NULL
+);
+
+CREATE TABLE Sponsor (
+    ID_Spo INTEGER PRIMARY KEY,
+    Sponsor_ID VARCHAR(10) NOT NULL,
+    Company_name VARCHAR(100) NOT NULL,
+    City VARCHAR(100),
+    Contact_info VARCHAR(100)
+);
+
+CREATE TABLE National_team (
+    ID_Nat INTEGER PRIMARY KEY,
+    Team_ID VARCHAR(10) NOT NULL,
+    Country VARCHAR(100) NOT NULL,
+    Confederation VARCHAR(100)
+);
+
+CREATE TABLE Player (
+    ID_Pla INTEGER PRIMARY KEY,
+    Player_ID VARCHAR(10) NOT NULL,
+    Name VARCHAR(100) NOT NULL,
+    Date_of_birth DATE NOT NULL,
+    Height DECIMAL(4, 2),
+    Citizenship VARCHAR(50),
+    Current_club_id INT,
+    CONSTRAINT FK_Player_Club FOREIGN KEY (Current_club_id) REFERENCES Clubs (ID_Clu)
+);
+
+---
+/* Tables de jeu et de statistiques (Structure principale corrigée) */
+
+/* [MODIFIÉ] La table Game ne contient plus les scores ou le vainqueur */
+CREATE TABLE Game (
+    ID_Gam INTEGER PRIMARY KEY,
+    Game_ID VARCHAR(10) NOT NULL,
+    Game_date DATE NOT NULL,
+    Location VARCHAR(100) NOT NULL,
+    Game_type VARCHAR(50) NOT NULL,
+    Season VARCHAR(50),
+    ID_Lea INT,
+    ID_Cha INT,
+    CONSTRAINT FK_Game_League FOREIGN KEY (ID_Lea) REFERENCES League (ID_Lea),
+    CONSTRAINT FK_Game_Championship FOREIGN KEY (ID_Cha) REFERENCES Championship (ID_Cha)
+);
+
+CREATE TABLE Game_Participant (
+    ID_Gam INT NOT NULL,
+    Participant_ID INT NOT NULL, -- Fait référence à ID_Clu OU ID_Nat
+    Participant_Type VARCHAR(20) NOT NULL, -- 'Club' ou 'National'
+    Score INT DEFAULT 0,
+    Role VARCHAR(10), -- 'Home' ou 'Away'
+    PRIMARY KEY (
+        ID_Gam,
+        Participant_ID,
+        Participant_Type
+    ),
+    CONSTRAINT FK_GP_Game FOREIGN KEY (ID_Gam) REFERENCES Game (ID_Gam),
+    CHECK (
+        Participant_Type IN ('Club', 'National')
+    )
+);
+
+/* [MODIFIÉ] Ajout des tirs tentés et des paniers à 2 points */
+/* Résout les problèmes des requêtes 1, 2, et 5 */
+CREATE TABLE PLAYER_GAME_STATS (
+    ID_Gam INT NOT NULL,
+    ID_Pla INT NOT NULL,
+    ID_Stat INT, -- renseigné par TRG_PGS_ID_Stat (pas de SERIAL hors clé primaire)
+
+-- Statistiques complètes pour les calculs
+
+
+Points_2pts_made INT DEFAULT 0,
+    Points_2pts_attempted INT DEFAULT 0,
+    Points_3pts_made INT DEFAULT 0,
+    Points_3pts_attempted INT DEFAULT 0,
+    Free_throws_made INT DEFAULT 0,
+    Free_throws_attempted INT DEFAULT 0,
+
+    Assists INT DEFAULT 0,
+    Rebounds INT DEFAULT 0,
+    Blocks INT DEFAULT 0,
+
+    PRIMARY KEY (ID_Gam, ID_Pla),
+    CONSTRAINT FK_PGS_Game FOREIGN KEY (ID_Gam)
+        REFERENCES Game(ID_Gam),
+    CONSTRAINT FK_PGS_Player FOREIGN KEY (ID_Pla)
+        REFERENCES Player(ID_Pla)
+);
+
+---
+/* Tables de liaison (Sponsors, Membres, etc.) */
+
+CREATE TABLE Has_Sponsor_Club (
+    ID_Clu INT NOT NULL,
+    ID_Spo INT NOT NULL,
+    PRIMARY KEY (ID_Clu, ID_Spo),
+    CONSTRAINT FK_HSC_Club FOREIGN KEY (ID_Clu) REFERENCES Clubs (ID_Clu),
+    CONSTRAINT FK_HSC_Sponsor FOREIGN KEY (ID_Spo) REFERENCES Sponsor (ID_Spo)
+);
+
+CREATE TABLE Has_Sponsor_Team (
+    ID_Nat INT NOT NULL,
+    ID_Spo INT NOT NULL,
+    PRIMARY KEY (ID_Nat, ID_Spo),
+    CONSTRAINT FK_HST_Team FOREIGN KEY (ID_Nat) REFERENCES National_team (ID_Nat),
+    CONSTRAINT FK_HST_Sponsor FOREIGN KEY (ID_Spo) REFERENCES Sponsor (ID_Spo)
+);
+
+CREATE TABLE Member_of (
+    ID_Pla INT NOT NULL,
+    ID_Nat INT NOT NULL,
+    Date_start DATE,
+    Date_end DATE,
+    PRIMARY KEY (ID_Pla, ID_Nat),
+    CONSTRAINT FK_Member_Player FOREIGN KEY (ID_Pla) REFERENCES Player (ID_Pla),
+    CONSTRAINT FK_Member_Team FOREIGN KEY (ID_Nat) REFERENCES National_team (ID_Nat)
+);
+
+/* Lie les équipes nationales inscrites à un championnat */
+CREATE TABLE Participates_in (
+    ID_Cha INT NOT NULL,
+    ID_Nat INT NOT NULL,
+    PRIMARY KEY (ID_Cha, ID_Nat),
+    CONSTRAINT FK_Participates_Champ FOREIGN KEY (ID_Cha) REFERENCES Championship (ID_Cha),
+    CONSTRAINT FK_Participates_Team FOREIGN KEY (ID_Nat) REFERENCES National_team (ID_Nat)
+);
+
+/* [NOUVEAU] Lie les clubs inscrits à une ligue */
+CREATE TABLE Participates_in_League (
+    ID_Lea INT NOT NULL,
+    ID_Clu INT NOT NULL,
+    PRIMARY KEY (ID_Lea, ID_Clu),
+    CONSTRAINT FK_PIL_League FOREIGN KEY (ID_Lea) REFERENCES League (ID_Lea),
+    CONSTRAINT FK_PIL_Club FOREIGN KEY (ID_Clu) REFERENCES Clubs (ID_Clu)
+);
+
+---
+/* Index pour améliorer les performances */
+
+CREATE INDEX IDX_Player_Club ON Player (Current_club_id);
+
+CREATE INDEX IDX_Game_League ON Game (ID_Lea);
+
+CREATE INDEX IDX_Game_Championship ON Game (ID_Cha);
+
+CREATE INDEX IDX_GP_Participant ON Game_Participant (
+    Participant_ID,
+    Participant_Type
+);
+
+CREATE INDEX IDX_PGS_Player ON PLAYER_GAME_STATS (ID_Pla);
+
+CREATE INDEX IDX_PGS_Game ON PLAYER_GAME_STATS (ID_Gam);
+
+CREATE INDEX IDX_HSC_Sponsor ON Has_Sponsor_Club (ID_Spo);
+
+CREATE INDEX IDX_HST_Sponsor ON Has_Sponsor_Team (ID_Spo);
+
+CREATE INDEX IDX_Member_Team ON Member_of (ID_Nat);
+
+CREATE INDEX IDX_Participates_Team ON Participates_in (ID_Nat);
+
+CREATE INDEX IDX_PIL_Club ON Participates_in_League (ID_Clu);
+
+/* [NOUVEAU] Index pour les recherches par nom (Optimisation) */
+CREATE INDEX IDX_League_Name ON League (Name);
+
+CREATE INDEX IDX_Championship_Name ON Championship (Name);
+
+CREATE INDEX IDX_Clubs_Name ON Clubs (Name);
+
+CREATE INDEX IDX_Player_Name ON Player (Name);
+
+/* [NOUVEAU] Index de pagination par clé (keyset) des listes joueurs et matchs */
+CREATE INDEX IDX_Player_Name_Id ON Player (Name, ID_Pla);
+
+CREATE INDEX IDX_Game_Date_Id ON Game (Game_date DESC, ID_Gam DESC);
+
+/* Pas de pg_trgm : la recherche par sous-chaîne parcourt la table, */
+/* word_similarity() est fournie par l'application (fonction Python). */
+
+/* [NOUVEAU] Index pour les filtres de match fréquents */
+CREATE INDEX IDX_Game_Type ON Game (Game_type);
+
+CREATE INDEX IDX_Game_Season ON Game (Season);
+
+---
+/* ID_Stat séquentiel (SERIAL hors clé primaire sous PostgreSQL) */
+CREATE INDEX IDX_PGS_Stat ON PLAYER_GAME_STATS (ID_Stat);
+
+CREATE TRIGGER TRG_PGS_ID_Stat AFTER INSERT ON PLAYER_GAME_STATS
+WHEN NEW.ID_Stat IS NULL
+BEGIN
+    UPDATE PLAYER_GAME_STATS
+    SET ID_Stat = (SELECT COALESCE(MAX(ID_Stat), 0) + 1 FROM PLAYER_GAME_STATS)
+    WHERE ID_Gam = NEW.ID_Gam AND ID_Pla = NEW.ID_Pla;
+END;
+
+---
+/* Statistiques de carrière agrégées par joueur (voir CreateTables.sql) */
+
+CREATE TABLE Player_Career_Stats (
+    ID_Pla INT PRIMARY KEY,
+    Games_played INT NOT NULL DEFAULT 0,
+    Points INT NOT NULL DEFAULT 0,
+    Rebounds INT NOT NULL DEFAULT 0,
+    Assists INT NOT NULL DEFAULT 0,
+    Blocks INT NOT NULL DEFAULT 0,
+    Points_2pts_made INT NOT NULL DEFAULT 0,
+    Points_2pts_attempted INT NOT NULL DEFAULT 0,
+    Points_3pts_made INT NOT NULL DEFAULT 0,
+    Points_3pts_attempted INT NOT NULL DEFAULT 0,
+    Free_throws_made INT NOT NULL DEFAULT 0,
+    Free_throws_attempted INT NOT NULL DEFAULT 0,
+    CONSTRAINT FK_PCS_Player FOREIGN KEY (ID_Pla) REFERENCES Player (ID_Pla)
+);
+
+CREATE TRIGGER TRG_PGS_Career_Stats_Insert AFTER INSERT ON PLAYER_GAME_STATS
+BEGIN
+    INSERT INTO Player_Career_Stats (
+        ID_Pla, Games_played, Points, Rebounds, Assists, Blocks,
+        Points_2pts_made, Points_2pts_attempted,
+        Points_3pts_made, Points_3pts_attempted,
+        Free_throws_made, Free_throws_attempted
+    ) VALUES (
+        NEW.ID_Pla,
+        1,
+        2 * COALESCE(NEW.Points_2pts_made, 0) + 3 * COALESCE(NEW.Points_3pts_made, 0) + COALESCE(NEW.Free_throws_made, 0),
+        COALESCE(NEW.Rebounds, 0),
+        COALESCE(NEW.Assists, 0),
+        COALESCE(NEW.Blocks, 0),
+        COALESCE(NEW.Points_2pts_made, 0),
+        COALESCE(NEW.Points_2pts_attempted, 0),
+        COALESCE(NEW.Points_3pts_made, 0),
+        COALESCE(NEW.Points_3pts_attempted, 0),
+        COALESCE(NEW.Free_throws_made, 0),
+        COALESCE(NEW.Free_throws_attempted, 0)
+    )
+    ON CONFLICT (ID_Pla) DO UPDATE SET
+        Games_played = Games_played + excluded.Games_played,
+        Points = Points + excluded.Points,
+        Rebounds = Rebounds + excluded.Rebounds,
+        Assists = Assists + excluded.Assists,
+        Blocks = Blocks + excluded.Blocks,
+        Points_2pts_made = Points_2pts_made + excluded.Points_2pts_made,
+        Points_2pts_attempted = Points_2pts_attempted + excluded.Points_2pts_attempted,
+        Points_3pts_made = Points_3pts_made + excluded.Points_3pts_made,
+        Points_3pts_attempted = Points_3pts_attempted + excluded.Points_3pts_attempted,
+        Free_throws_made = Free_throws_made + excluded.Free_throws_made,
+        Free_throws_attempted = Free_throws_attempted + excluded.Free_throws_attempted;
+END;
+
+CREATE TRIGGER TRG_PGS_Career_Stats_Update AFTER UPDATE OF
+    ID_Pla, Points_2pts_made, Points_2pts_attempted, Points_3pts_made, Points_3pts_attempted,
+    Free_throws_made, Free_throws_attempted, Assists, Rebounds, Blocks
+ON PLAYER_GAME_STATS
+BEGIN
+    UPDATE Player_Career_Stats SET
+        Games_played = Games_played - 1,
+        Points = Points - (2 * COALESCE(OLD.Points_2pts_made, 0) + 3 * COALESCE(OLD.Points_3pts_made, 0) + COALESCE(OLD.Free_throws_made, 0)),
+        Rebounds = Rebounds - COALESCE(OLD.Rebounds, 0),
+        Assists = Assists - COALESCE(OLD.Assists, 0),
+        Blocks = Blocks - COALESCE(OLD.Blocks, 0),
+        Points_2pts_made = Points_2pts_made - COALESCE(OLD.Points_2pts_made, 0),
+        Points_2pts_attempted = Points_2pts_attempted - COALESCE(OLD.Points_2pts_attempted, 0),
+        Points_3pts_made = Points_3pts_made - COALESCE(OLD.Points_3pts_made, 0),
+        Points_3pts_attempted = Points_3pts_attempted - COALESCE(OLD.Points_3pts_attempted, 0),
+        Free_throws_made = Free_throws_made - COALESCE(OLD.Free_throws_made, 0),
+        Free_throws_attempted = Free_throws_attempted - COALESCE(OLD.Free_throws_attempted, 0)
+    WHERE ID_Pla = OLD.ID_Pla;
+
+    DELETE FROM Player_Career_Stats
+    WHERE ID_Pla = OLD.ID_Pla AND Games_played <= 0;
+
+    INSERT INTO Player_Career_Stats (
+        ID_Pla, Games_played, Points, Rebounds, Assists, Blocks,
+        Points_2pts_made, Points_2pts_attempted,
+        Points_3pts_made, Points_3pts_attempted,
+        Free_throws_made, Free_throws_attempted
+    ) VALUES (
+        NEW.ID_Pla,
+        1,
+        2 * COALESCE(NEW.Points_2pts_made, 0) + 3 * COALESCE(NEW.Points_3pts_made, 0) + COALESCE(NEW.Free_throws_made, 0),
+        COALESCE(NEW.Rebounds, 0),
+        COALESCE(NEW.Assists, 0),
+        COALESCE(NEW.Blocks, 0),
+        COALESCE(NEW.Points_2pts_made, 0),
+        COALESCE(NEW.Points_2pts_attempted, 0),
+        COALESCE(NEW.Points_3pts_made, 0),
+        COALESCE(NEW.Points_3pts_attempted, 0),
+        COALESCE(NEW.Free_throws_made, 0),
+        COALESCE(NEW.Free_throws_attempted, 0)
+    )
+    ON CONFLICT (ID_Pla) DO UPDATE SET
+        Games_played = Games_played + excluded.Games_played,
+        Points = Points + excluded.Points,
+        Rebounds = Rebounds + excluded.Rebounds,
+        Assists = Assists + excluded.Assists,
+        Blocks = Blocks + excluded.Blocks,
+        Points_2pts_made = Points_2pts_made + excluded.Points_2pts_made,
+        Points_2pts_attempted = Points_2pts_attempted + excluded.Points_2pts_attempted,
+        Points_3pts_made = Points_3pts_made + excluded.Points_3pts_made,
+        Points_3pts_attempted = Points_3pts_attempted + excluded.Points_3pts_attempted,
+        Free_throws_made = Free_throws_made + excluded.Free_throws_made,
+        Free_throws_attempted = Free_throws_attempted + excluded.Free_throws_attempted;
+END;
+
+CREATE TRIGGER TRG_PGS_Career_Stats_Delete AFTER DELETE ON PLAYER_GAME_STATS
+BEGIN
+    UPDATE Player_Career_Stats SET
+        Games_played = Games_played - 1,
+        Points = Points - (2 * COALESCE(OLD.Points_2pts_made, 0) + 3 * COALESCE(OLD.Points_3pts_made, 0) + COALESCE(OLD.Free_throws_made, 0)),
+        Rebounds = Rebounds - COALESCE(OLD.Rebounds, 0),
+        Assists = Assists - COALESCE(OLD.Assists, 0),
+        Blocks = Blocks - COALESCE(OLD.Blocks, 0),
+        Points_2pts_made = Points_2pts_made - COALESCE(OLD.Points_2pts_made, 0),
+        Points_2pts_attempted = Points_2pts_attempted - COALESCE(OLD.Points_2pts_attempted, 0),
+        Points_3pts_made = Points_3pts_made - COALESCE(OLD.Points_3pts_made, 0),
+        Points_3pts_attempted = Points_3pts_attempted - COALESCE(OLD.Points_3pts_attempted, 0),
+        Free_throws_made = Free_throws_made - COALESCE(OLD.Free_throws_made, 0),
+        Free_throws_attempted = Free_throws_attempted - COALESCE(OLD.Free_throws_attempted, 0)
+    WHERE ID_Pla = OLD.ID_Pla;
+
+    DELETE FROM Player_Career_Stats
+    WHERE ID_Pla = OLD.ID_Pla AND Games_played <= 0;
+END;
+
+---
+/* Classements pré-calculés par périmètre (voir CreateTables.sql) */
+
+CREATE TABLE Leaderboard_Totals (
+    Scope VARCHAR(12) NOT NULL,
+    Scope_key VARCHAR(50) NOT NULL,
+    ID_Pla INT NOT NULL,
+    Games_played INT NOT NULL DEFAULT 0,
+    Points INT NOT NULL DEFAULT 0,
+    Rebounds INT NOT NULL DEFAULT 0,
+    Assists INT NOT NULL DEFAULT 0,
+    Blocks INT NOT NULL DEFAULT 0,
+    Points_3pts_made INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (Scope, Scope_key, ID_Pla),
+    CONSTRAINT FK_LT_Player FOREIGN KEY (ID_Pla) REFERENCES Player (ID_Pla),
+    CONSTRAINT CK_LT_Scope CHECK (Scope IN ('overall', 'season', 'league', 'championship', 'national'))
+);
+
+CREATE INDEX IDX_LT_Points ON Leaderboard_Totals (Scope, Scope_key, Points DESC, ID_Pla);
+
+CREATE INDEX IDX_LT_Rebounds ON Leaderboard_Totals (Scope, Scope_key, Rebounds DESC, ID_Pla);
+
+CREATE INDEX IDX_LT_Assists ON Leaderboard_Totals (Scope, Scope_key, Assists DESC, ID_Pla);
+
+CREATE INDEX IDX_LT_Blocks ON Leaderboard_Totals (Scope, Scope_key, Blocks DESC, ID_Pla);
+
+CREATE INDEX IDX_LT_Points_3pts ON Leaderboard_Totals (Scope, Scope_key, Points_3pts_made DESC, ID_Pla);
+
+CREATE VIEW Game_Leaderboard_Scope AS
+SELECT ID_Gam, 'overall' AS Scope, '' AS Scope_key FROM Game
+UNION ALL
+SELECT ID_Gam, 'season', Season FROM Game WHERE Season IS NOT NULL
+UNION ALL
+SELECT ID_Gam, 'league', CAST(ID_Lea AS TEXT) FROM Game WHERE ID_Lea IS NOT NULL
+UNION ALL
+SELECT ID_Gam, 'championship', CAST(ID_Cha AS TEXT) FROM Game WHERE ID_Cha IS NOT NULL
+UNION ALL
+SELECT ID_Gam, 'national', '' FROM Game WHERE ID_Cha IS NOT NULL;
+
+CREATE TRIGGER TRG_PGS_Leaderboard_Totals_Insert AFTER INSERT ON PLAYER_GAME_STATS
+BEGIN
+    INSERT INTO Leaderboard_Totals (
+        Scope, Scope_key, ID_Pla, Games_played, Points, Rebounds, Assists, Blocks, Points_3pts_made
+    )
+    SELECT
+        s.Scope, s.Scope_key, NEW.ID_Pla, 1,
+        2 * COALESCE(NEW.Points_2pts_made, 0) + 3 * COALESCE(NEW.Points_3pts_made, 0) + COALESCE(NEW.Free_throws_made, 0),
+        COALESCE(NEW.Rebounds, 0),
+        COALESCE(NEW.Assists, 0),
+        COALESCE(NEW.Blocks, 0),
+        COALESCE(NEW.Points_3pts_made, 0)
+    FROM Game_Leaderboard_Scope s
+    WHERE s.ID_Gam = NEW.ID_Gam
+    ON CONFLICT (Scope, Scope_key, ID_Pla) DO UPDATE SET
+        Games_played = Games_played + excluded.Games_played,
+        Points = Points + excluded.Points,
+        Rebounds = Rebounds + excluded.Rebounds,
+        Assists = Assists + excluded.Assists,
+        Blocks = Blocks + excluded.Blocks,
+        Points_3pts_made = Points_3pts_made + excluded.Points_3pts_made;
+END;
+
+CREATE TRIGGER TRG_PGS_Leaderboard_Totals_Update AFTER UPDATE OF
+    ID_Gam, ID_Pla, Points_2pts_made, Points_3pts_made, Free_throws_made, Assists, Rebounds, Blocks
+ON PLAYER_GAME_STATS
+BEGIN
+    UPDATE Leaderboard_Totals SET
+        Games_played = Games_played - 1,
+        Points = Points - (2 * COALESCE(OLD.Points_2pts_made, 0) + 3 * COALESCE(OLD.Points_3pts_made, 0) + COALESCE(OLD.Free_throws_made, 0)),
+        Rebounds = Rebounds - COALESCE(OLD.Rebounds, 0),
+        Assists = Assists - COALESCE(OLD.Assists, 0),
+        Blocks = Blocks - COALESCE(OLD.Blocks, 0),
+        Points_3pts_made = Points_3pts_made - COALESCE(OLD.Points_3pts_made, 0)
+    WHERE ID_Pla = OLD.ID_Pla
+      AND (Scope, Scope_key) IN (
+          SELECT Scope, Scope_key FROM Game_Leaderboard_Scope WHERE ID_Gam = OLD.ID_Gam
+      );
+
+    DELETE FROM Leaderboard_Totals
+    WHERE ID_Pla = OLD.ID_Pla AND Games_played <= 0;
+
+    INSERT INTO Leaderboard_Totals (
+        Scope, Scope_key, ID_Pla, Games_played, Points, Rebounds, Assists, Blocks, Points_3pts_made
+    )
+    SELECT
+        s.Scope, s.Scope_key, NEW.ID_Pla, 1,
+        2 * COALESCE(NEW.Points_2pts_made, 0) + 3 * COALESCE(NEW.Points_3pts_made, 0) + COALESCE(NEW.Free_throws_made, 0),
+        COALESCE(NEW.Rebounds, 0),
+        COALESCE(NEW.Assists, 0),
+        COALESCE(NEW.Blocks, 0),
+        COALESCE(NEW.Points_3pts_made, 0)
+    FROM Game_Leaderboard_Scope s
+    WHERE s.ID_Gam = NEW.ID_Gam
+    ON CONFLICT (Scope, Scope_key, ID_Pla) DO UPDATE SET
+        Games_played = Games_played + excluded.Games_played,
+        Points = Points + excluded.Points,
+        Rebounds = Rebounds + excluded.Rebounds,
+        Assists = Assists + excluded.Assists,
+        Blocks = Blocks + excluded.Blocks,
+        Points_3pts_made = Points_3pts_made + excluded.Points_3pts_made;
+END;
+
+CREATE TRIGGER TRG_PGS_Leaderboard_Totals_Delete AFTER DELETE ON PLAYER_GAME_STATS
+BEGIN
+    UPDATE Leaderboard_Totals SET
+        Games_played = Games_played - 1,
+        Points = Points - (2 * COALESCE(OLD.Points_2pts_made, 0) + 3 * COALESCE(OLD.Points_3pts_made, 0) + COALESCE(OLD.Free_throws_made, 0)),
+        Rebounds = Rebounds - COALESCE(OLD.Rebounds, 0),
+        Assists = Assists - COALESCE(OLD.Assists, 0),
+        Blocks = Blocks - COALESCE(OLD.Blocks, 0),
+        Points_3pts_made = Points_3pts_made - COALESCE(OLD.Points_3pts_made, 0)
+    WHERE ID_Pla = OLD.ID_Pla
+      AND (Scope, Scope_key) IN (
+          SELECT Scope, Scope_key FROM Game_Leaderboard_Scope WHERE ID_Gam = OLD.ID_Gam
+      );
+
+    DELETE FROM Leaderboard_Totals
+    WHERE ID_Pla = OLD.ID_Pla AND Games_played <= 0;
+END;
+
+/* Un match qui change de saison, de ligue ou de championnat déplace ses lignes */
+CREATE TRIGGER TRG_Game_Leaderboard_Totals AFTER UPDATE OF Season, ID_Lea, ID_Cha ON Game
+WHEN OLD.Season IS NOT NEW.Season OR OLD.ID_Lea IS NOT NEW.ID_Lea OR OLD.ID_Cha IS NOT NEW.ID_Cha
+BEGIN
+    UPDATE Leaderboard_Totals SET
+        Games_played = Leaderboard_Totals.Games_played - 1,
+        Points = Leaderboard_Totals.Points - (2 * COALESCE(pgs.Points_2pts_made, 0) + 3 * COALESCE(pgs.Points_3pts_made, 0) + COALESCE(pgs.Free_throws_made, 0)),
+        Rebounds = Leaderboard_Totals.Rebounds - COALESCE(pgs.Rebounds, 0),
+        Assists = Leaderboard_Totals.Assists - COALESCE(pgs.Assists, 0),
+        Blocks = Leaderboard_Totals.Blocks - COALESCE(pgs.Blocks, 0),
+        Points_3pts_made = Leaderboard_Totals.Points_3pts_made - COALESCE(pgs.Points_3pts_made, 0)
+    FROM PLAYER_GAME_STATS pgs, (
+        SELECT 'season' AS Scope, OLD.Season AS Scope_key
+        UNION ALL SELECT 'league', CAST(OLD.ID_Lea AS TEXT)
+        UNION ALL SELECT 'championship', CAST(OLD.ID_Cha AS TEXT)
+        UNION ALL SELECT 'national', CASE WHEN OLD.ID_Cha IS NOT NULL THEN '' END
+    ) s
+    WHERE pgs.ID_Gam = OLD.ID_Gam
+      AND Leaderboard_Totals.ID_Pla = pgs.ID_Pla
+      AND Leaderboard_Totals.Scope = s.Scope
+      AND Leaderboard_Totals.Scope_key = s.Scope_key;
+
+    DELETE FROM Leaderboard_Totals
+    WHERE Games_played <= 0
+      AND ID_Pla IN (SELECT ID_Pla FROM PLAYER_GAME_STATS WHERE ID_Gam = OLD.ID_Gam);
+
+    INSERT INTO Leaderboard_Totals (
+        Scope, Scope_key, ID_Pla, Games_played, Points, Rebounds, Assists, Blocks, Points_3pts_made
+    )
+    SELECT
+        s.Scope, s.Scope_key, pgs.ID_Pla, 1,
+        2 * COALESCE(pgs.Points_2pts_made, 0) + 3 * COALESCE(pgs.Points_3pts_made, 0) + COALESCE(pgs.Free_throws_made, 0),
+        COALESCE(pgs.Rebounds, 0),
+        COALESCE(pgs.Assists, 0),
+        COALESCE(pgs.Blocks, 0),
+        COALESCE(pgs.Points_3pts_made, 0)
+    FROM PLAYER_GAME_STATS pgs
+    JOIN Game_Leaderboard_Scope s ON s.ID_Gam = pgs.ID_Gam
+    WHERE pgs.ID_Gam = NEW.ID_Gam AND s.Scope <> 'overall'
+    ON CONFLICT (Scope, Scope_key, ID_Pla) DO UPDATE SET
+        Games_played = Games_played + excluded.Games_played,
+        Points = Points + excluded.Points,
+        Rebounds = Rebounds + excluded.Rebounds,
+        Assists = Assists + excluded.Assists,
+        Blocks = Blocks + excluded.Blocks,
+        Points_3pts_made = Points_3pts_made + excluded.Points_3pts_made;
+END;
+
+---
+/* Version des données par table (cache de résultats de l'exécuteur SQL) */
+/* Pas de version propre aux tables dérivées (Player_Career_Stats, Leaderboard_Totals) : */
+/* elles suivent celle de PLAYER_GAME_STATS (voir CreateTables.sql). */
+
+CREATE TABLE Data_Version (
+    Table_name VARCHAR(63) PRIMARY KEY,
+    Version BIGINT NOT NULL DEFAULT 0,
+    Changed_at TIMESTAMP NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+);
+
+/* Lignes et triggers (INSERT / UPDATE / DELETE) de chaque table versionnée : générés */
+/* par dialect.sqlite_data_version_script() depuis VERSIONED_TABLES, ajoutés à ce script */
+/* par create_schema(). */
+
+---
+/* Vues d'exercice et classements : vues simples (pas de vue matérialisée sous SQLite) */
+
+CREATE VIEW MV_Top_National_Team_Scorers AS
+SELECT p.ID_Pla, p.Player_ID, p.Name, SUM(
+        2 * pgs.Points_2pts_made + 3 * pgs.Points_3pts_made + pgs.Free_throws_made
+    ) AS Total_points
+FROM
+    Player p
+    JOIN PLAYER_GAME_STATS pgs ON p.ID_Pla = pgs.ID_Pla
+    JOIN Game g ON g.ID_Gam = pgs.ID_Gam
+WHERE
+    g.Game_type IN ('Group Stage', 'Final')
+GROUP BY
+    p.ID_Pla,
+    p.Player_ID,
+    p.Name;
+
+CREATE VIEW MV_Club_Average_Height AS
+SELECT c.ID_Clu, c.Club_ID, c.Name AS Club_name, AVG(p.Height) AS Avg_height
+FROM Clubs c
+    JOIN Player p ON p.Current_club_ID = c.ID_Clu
+GROUP BY
+    c.ID_Clu,
+    c.Club_ID,
+    c.Name;
+
+CREATE VIEW MV_Sponsors_Of_National_Teams AS
+SELECT hst.ID_Spo, hst.ID_Nat, s.Company_name, s.City, t.Country
+FROM
+    Has_Sponsor_Team hst
+    JOIN Sponsor s ON s.ID_Spo = hst.ID_Spo
+    JOIN National_team t ON t.ID_Nat = hst.ID_Nat;
+
+/* Classement des joueurs par saison (points, rebonds, passes, contres) */
+CREATE VIEW MV_Season_Player_Leaderboard AS
+SELECT
+    COALESCE(g.Season, 'N/A') AS Season,
+    p.ID_Pla,
+    p.Name,
+    COUNT(*) AS Games_played,
+    SUM(
+        2 * COALESCE(pgs.Points_2pts_made, 0)
+        + 3 * COALESCE(pgs.Points_3pts_made, 0)
+        + COALESCE(pgs.Free_throws_made, 0)
+    ) AS Points,
+    SUM(COALESCE(pgs.Rebounds, 0)) AS Rebounds,
+    SUM(COALESCE(pgs.Assists, 0)) AS Assists,
+    SUM(COALESCE(pgs.Blocks, 0)) AS Blocks
+FROM
+    PLAYER_GAME_STATS pgs
+    JOIN Player p ON p.ID_Pla = pgs.ID_Pla
+    JOIN Game g ON g.ID_Gam = pgs.ID_Gam
+GROUP BY
+    COALESCE(g.Season, 'N/A'),
+    p.ID_Pla,
+    p.Name;
+
+/* Classement des clubs par saison (victoires, défaites, points marqués / encaissés) */
+CREATE VIEW MV_Season_Club_Standings AS
+SELECT
+    COALESCE(g.Season, 'N/A') AS Season,
+    c.ID_Clu,
+    c.Name AS Club_name,
+    COUNT(*) AS Games_played,
+    COUNT(*) FILTER (WHERE gp.Score > opp.Score) AS Wins,
+    COUNT(*) FILTER (WHERE gp.Score < opp.Score) AS Losses,
+    SUM(gp.Score) AS Points_for,
+    SUM(opp.Score) AS Points_against
+FROM
+    Game_Participant gp
+    JOIN Game_Participant opp ON opp.ID_Gam = gp.ID_Gam
+    AND (opp.Participant_ID, opp.Participant_Type) <> (gp.Participant_ID, gp.Participant_Type)
+    JOIN Game g ON g.ID_Gam = gp.ID_Gam
+    JOIN Clubs c ON c.ID_Clu = gp.Participant_ID
+WHERE
+    gp.Participant_Type = 'Club'
+GROUP BY
+    COALESCE(g.Season, 'N/A'),
+    c.ID_Clu,
+    c.Name;
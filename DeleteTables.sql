@@ -1,4 +1,16 @@
-DROP TABLE IF EXISTS PLAYER_GAME_STATS,
+DROP MATERIALIZED VIEW IF EXISTS MV_Top_National_Team_Scorers,
+MV_Club_Average_Height,
+MV_Sponsors_Of_National_Teams,
+MV_Season_Player_Leaderboard,
+MV_Season_Club_Standings CASCADE;
+
+DROP VIEW IF EXISTS Game_Leaderboard_Scope CASCADE;
+
+DROP TABLE IF EXISTS Matview_Refresh_Log,
+Data_Version,
+Leaderboard_Totals,
+Player_Career_Stats,
+PLAYER_GAME_STATS,
 Championship,
 Clubs,
 Game,
@@ -11,4 +23,9 @@ Has_Sponsor_Team,
 Member_of,
 Participates_in,
 Game_Participant,
-Participates_in_League CASCADE;
\ No newline at end of file
+Participates_in_League CASCADE;
+
+DROP FUNCTION IF EXISTS Player_Career_Stats_Apply(), Rebuild_Player_Career_Stats(),
+Leaderboard_Totals_Apply(), Leaderboard_Totals_Move_Game(), Rebuild_Leaderboard_Totals(),
+Refresh_Materialized_View(TEXT),
+Data_Version_Bump(), Bump_Table_Version(TEXT) CASCADE;
\ No newline at end of file
@@ -0,0 +1,3 @@
+SELECT club_id, club_name, avg_height
+FROM MV_Club_Average_Height
+ORDER BY avg_height DESC;
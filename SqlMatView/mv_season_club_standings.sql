@@ -0,0 +1,4 @@
+SELECT season, club_name, games_played, wins, losses, points_for, points_against,
+    points_for - points_against AS point_diff
+FROM MV_Season_Club_Standings
+ORDER BY season DESC, wins DESC, point_diff DESC;
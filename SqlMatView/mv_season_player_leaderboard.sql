@@ -0,0 +1,5 @@
+SELECT season, name, games_played, points, rebounds, assists, blocks,
+    ROUND(points * 1.0 / games_played, 1) AS points_per_game
+FROM MV_Season_Player_Leaderboard
+ORDER BY season DESC, points DESC, name
+LIMIT 100;
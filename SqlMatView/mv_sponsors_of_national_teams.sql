@@ -0,0 +1,3 @@
+SELECT company_name, city, country
+FROM MV_Sponsors_Of_National_Teams
+ORDER BY country, company_name;
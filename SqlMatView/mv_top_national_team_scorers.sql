@@ -0,0 +1,3 @@
+SELECT player_id, name, total_points
+FROM MV_Top_National_Team_Scorers
+ORDER BY total_points DESC, name;
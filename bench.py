@@ -0,0 +1,300 @@
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from sqlalchemy import make_url, text
+
+from app import create_app, db, install_view, invalidate_tables
+from seed_db import run_seed
+
+app = create_app()
+query_registry = app.extensions["bd"]["query_registry"]
+
+# Statistiques relevées pour chaque cible, comparées à la référence (--baseline)
+COMPARED_PERCENTILE = "p95"
+SERVER_TIMING_STATEMENTS = re.compile(r'desc="(\d+) statements')
+
+
+def percentile(sorted_values, fraction):
+    # Rang le plus proche : pas d'interpolation, reproductible sur peu d'échantillons
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(durations, statements, peak_bytes):
+    values = sorted(durations)
+    return {
+        "samples": len(values),
+        "mean_ms": round(sum(values) / len(values), 3),
+        "p50_ms": round(percentile(values, 0.50), 3),
+        "p95_ms": round(percentile(values, 0.95), 3),
+        "p99_ms": round(percentile(values, 0.99), 3),
+        "statements": statements,
+        "peak_kb": round(peak_bytes / 1024, 1),
+    }
+
+
+def measure(target, iterations, warmup, cold):
+    # target() renvoie le nombre d'instructions SQL de l'appel (ou None)
+    for _ in range(warmup):
+        target()
+    durations = []
+    statements = None
+    for _ in range(iterations):
+        if cold:
+            with app.app_context():
+                invalidate_tables()
+        started = time.perf_counter()
+        statements = target()
+        durations.append((time.perf_counter() - started) * 1000)
+
+    # Mémoire mesurée à part : tracemalloc ralentit fortement l'exécution
+    if cold:
+        with app.app_context():
+            invalidate_tables()
+    tracemalloc.start()
+    target()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return summarize(durations, statements, peak)
+
+
+def sample_ids():
+    with app.app_context():
+        player_id = db.session.execute(text("SELECT MIN(id_pla) FROM player")).scalar()
+        game_id = db.session.execute(text("SELECT MAX(id_gam) FROM game")).scalar()
+        name = db.session.execute(
+            text("SELECT name FROM player WHERE id_pla = :id"), {"id": player_id}
+        ).scalar() or "a"
+    return {"player_id": player_id, "game_id": game_id}, name[:3]
+
+
+def route_targets(client):
+    # Toutes les routes GET de l'application (sauf fichiers statiques et déconnexion),
+    # les paramètres d'URL étant remplis avec des identifiants existants
+    url_args, search = sample_ids()
+    targets = {}
+    with app.test_request_context():
+        for rule in app.url_map.iter_rules():
+            if "GET" not in rule.methods or rule.endpoint in ("static", "logout"):
+                continue
+            if set(rule.arguments) - set(url_args):
+                continue
+            url = app.url_for(rule.endpoint, **{name: url_args[name] for name in rule.arguments})
+            targets[rule.endpoint] = url
+        targets["players_search"] = app.url_for("players", q=search)
+        targets["player_autocomplete"] = app.url_for("player_autocomplete", q=search)
+        targets["admin_sql_export"] = app.url_for("admin_sql_export", query_key="req1", format="csv")
+        targets["leaderboard"] = app.url_for("leaderboard", scope="overall", stat="points")
+        targets["analytics_groups"] = app.url_for("analytics_groups", dimension="season", stat="points")
+
+    def request_target(url):
+        def run():
+            response = client.get(url)
+            response.get_data()
+            if response.status_code >= 400:
+                raise RuntimeError(f"GET {url} returned {response.status_code}")
+            match = SERVER_TIMING_STATEMENTS.search(response.headers.get("Server-Timing", ""))
+            return int(match.group(1)) if match else None
+        return run
+
+    return {f"GET {name}": request_target(url) for name, url in sorted(targets.items())}
+
+
+def runner_targets(client):
+    # Chaque requête prédéfinie passée par l'exécuteur SQL, cache de résultats ignoré
+    def post(key):
+        def run():
+            response = client.post("/admin/sql", data={"query_key": key, "mode": "refresh"})
+            body = response.get_data(as_text=True)
+            if response.status_code >= 400 or "Erreur :" in body:
+                raise RuntimeError(f"admin_sql {key} failed")
+            match = SERVER_TIMING_STATEMENTS.search(response.headers.get("Server-Timing", ""))
+            return int(match.group(1)) if match else None
+        return run
+
+    return {
+        f"POST admin_sql {key}": post(key)
+        for key, query in sorted(query_registry.queries().items())
+        if query.returns_rows
+    }
+
+
+def query_targets():
+    # Requêtes exécutées directement (sans HTTP), résultat entièrement lu
+    def execute(query):
+        def run():
+            with app.app_context():
+                if query.kind == "view":
+                    install_view(query, app.config["SQL_RUNNER_TIMEOUT_MS"])
+                db.session.execute(text(query.run_sql)).fetchall()
+                db.session.rollback()
+            return 1
+        return run
+
+    return {
+        f"SQL {key}": execute(query)
+        for key, query in sorted(query_registry.queries().items())
+        if query.returns_rows
+    }
+
+
+def login(client, username, password):
+    response = client.post("/login", data={"username": username, "password": password})
+    if response.status_code != 302:
+        raise RuntimeError(f"Login failed for {username}")
+
+
+def seed_dsn():
+    # seed_db.py doit charger la base que l'application mesure (DATABASE_URL),
+    # pas celle désignée par ses variables DB_HOST / DB_NAME
+    url = make_url(app.config["SQLALCHEMY_DATABASE_URI"])
+    if url.get_backend_name() != "postgresql":
+        sys.exit(f"seed_db.py only loads PostgreSQL, not {url.get_backend_name()}: use --no-seed")
+    return url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+def run_scale(scale, args):
+    if not args.no_seed:
+        print(f"Seeding scale {scale}...", flush=True)
+        run_seed(scale=scale, seed=args.seed, seasons=args.seasons, workers=args.workers, dsn=seed_dsn())
+        with app.app_context():
+            invalidate_tables()
+
+    client = app.test_client()
+    login(client, "admin", "admin123")
+    targets = {**route_targets(client), **runner_targets(client), **query_targets()}
+    if args.only:
+        targets = {name: target for name, target in targets.items() if re.search(args.only, name)}
+
+    results = {}
+    for name, target in targets.items():
+        try:
+            stats = results[name] = measure(target, args.iterations, args.warmup, args.cold)
+        except Exception as exc:
+            # Une cible en échec n'interrompt pas la campagne ; signalée à la comparaison
+            results[name] = {"error": str(exc).splitlines()[0][:300]}
+            print(f"  {name:<45} FAILED: {results[name]['error']}", flush=True)
+            continue
+        print(
+            f"  {name:<45} p50 {stats['p50_ms']:>8.2f} ms  p95 {stats['p95_ms']:>8.2f} ms  "
+            f"p99 {stats['p99_ms']:>8.2f} ms  {'-' if stats['statements'] is None else stats['statements']:>3} stmts  "
+            f"{stats['peak_kb']:>9.1f} KiB",
+            flush=True,
+        )
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline, threshold, min_delta_ms, memory_threshold):
+    # Régression : p95 plus lent de `threshold` (et d'au moins min_delta_ms, contre le bruit),
+    # davantage d'instructions SQL, ou pic mémoire plus haut de `memory_threshold`
+    regressions = []
+    for scale, targets in current["scales"].items():
+        reference = baseline.get("scales", {}).get(scale, {})
+        for name, stats in targets.items():
+            before = reference.get(name)
+            if before is None:
+                continue
+            if "error" in stats:
+                if "error" not in before:
+                    regressions.append(f"[scale {scale}] {name}: failed ({stats['error']})")
+                continue
+            if "error" in before:
+                continue
+            old_ms, new_ms = before[f"{COMPARED_PERCENTILE}_ms"], stats[f"{COMPARED_PERCENTILE}_ms"]
+            if new_ms > old_ms * (1 + threshold) and new_ms - old_ms >= min_delta_ms:
+                regressions.append(
+                    f"[scale {scale}] {name}: {COMPARED_PERCENTILE} {old_ms:.2f} -> {new_ms:.2f} ms"
+                )
+            if before["statements"] is not None and stats["statements"] is not None \
+                    and stats["statements"] > before["statements"]:
+                regressions.append(
+                    f"[scale {scale}] {name}: statements {before['statements']} -> {stats['statements']}"
+                )
+            if stats["peak_kb"] > before["peak_kb"] * (1 + memory_threshold) \
+                    and stats["peak_kb"] - before["peak_kb"] >= 64:
+                regressions.append(
+                    f"[scale {scale}] {name}: peak memory {before['peak_kb']} -> {stats['peak_kb']} KiB"
+                )
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the app routes and predefined SQL queries.")
+    parser.add_argument(
+        "--scales", default="1",
+        help="Comma-separated seed_db.py scale factors, each seeded then measured (default: 1)",
+    )
+    parser.add_argument("--no-seed", action="store_true", help="Measure the current database as is")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed passed to seed_db.py (default: 42)")
+    parser.add_argument("--seasons", type=int, default=1, help="Seasons per league (default: 1)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Seed worker processes")
+    parser.add_argument("--iterations", type=int, default=20, help="Measured runs per target (default: 20)")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured runs per target (default: 2)")
+    parser.add_argument("--cold", action="store_true", help="Clear the in-process caches before each run")
+    parser.add_argument("--only", help="Regex: only measure targets whose name matches")
+    parser.add_argument("--output", default="bench-results.json", help="Results file (default: bench-results.json)")
+    parser.add_argument("--baseline", help="Previous results file to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.20,
+        help=f"Allowed relative {COMPARED_PERCENTILE} slowdown before failing (default: 0.20)",
+    )
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=2.0,
+        help="Ignore slowdowns smaller than this, in ms (default: 2.0)",
+    )
+    parser.add_argument(
+        "--memory-threshold", type=float, default=0.50,
+        help="Allowed relative peak memory increase before failing (default: 0.50)",
+    )
+    args = parser.parse_args()
+    # Une ligne JSON par requête HTTP : inutile ici, les totaux sont relevés par cible
+    logging.getLogger("bd.requests").setLevel(logging.WARNING)
+
+    results = {
+        "meta": {
+            "revision": git_revision(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "database": app.config["SQLALCHEMY_DATABASE_URI"].rsplit("@", 1)[-1],
+            "iterations": args.iterations,
+            "cold": args.cold,
+        },
+        "scales": {},
+    }
+    for scale in [int(value) for value in args.scales.split(",")]:
+        print(f"Scale {scale}")
+        results["scales"][str(scale)] = run_scale(scale, args)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms, args.memory_threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline} ({baseline['meta'].get('revision')}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regression against {args.baseline} ({baseline['meta'].get('revision')}).")
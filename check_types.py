@@ -1,5 +1,5 @@
-from app import app, db, Game
+from app import create_app, db, Game
 
-with app.app_context():
+with create_app().app_context():
     types = db.session.query(Game.game_type).distinct().all()
     print("Game Types:", [t[0] for t in types])
@@ -0,0 +1,358 @@
+import threading
+import time
+
+import numpy as np
+from sqlalchemy import text
+
+# Colonnes de PLAYER_GAME_STATS chargées en mémoire, une ligne par joueur et par match
+STAT_COLUMNS = (
+    "points_2pts_made", "points_2pts_attempted",
+    "points_3pts_made", "points_3pts_attempted",
+    "free_throws_made", "free_throws_attempted",
+    "assists", "rebounds", "blocks",
+)
+STATS = ("points", *STAT_COLUMNS)
+# Regroupements par match proposés (les clés "player" servent aux calculs par joueur)
+DIMENSIONS = ("season", "league", "championship")
+
+# Tables dont le contenu est reflété par le moteur (versions lues dans Data_Version)
+TABLES = ("player_game_stats", "game")
+
+LOAD_CHUNK_ROWS = 50000
+
+STATS_SQL = text(
+    "SELECT id_stat, id_gam, id_pla, "
+    + ", ".join(f"COALESCE({column}, 0)" for column in STAT_COLUMNS)
+    + " FROM player_game_stats WHERE id_stat > :after"
+)
+GAMES_SQL = text("SELECT id_gam, season, id_lea, id_cha FROM game ORDER BY id_gam")
+
+
+class _Games:
+    # Clés de regroupement par match, triées par id_gam (-1 = absente)
+
+    def __init__(self, rows):
+        labels = sorted({season for _, season, _, _ in rows if season})
+        codes = {label: code for code, label in enumerate(labels)}
+        self.ids = np.array([row[0] for row in rows], dtype=np.int64)
+        self.keys = {
+            "season": np.array([codes.get(row[1], -1) for row in rows], dtype=np.int32),
+            "league": np.array([-1 if row[2] is None else row[2] for row in rows], dtype=np.int64),
+            "championship": np.array([-1 if row[3] is None else row[3] for row in rows], dtype=np.int64),
+        }
+        self.seasons = labels
+
+    def positions(self, game_ids):
+        # Position de chaque match dans self.ids (-1 si inconnu), par table de
+        # correspondance indexée par id_gam (identifiants denses)
+        lookup = np.full(int(max(self.ids.max(initial=0), game_ids.max(initial=0))) + 1, -1, dtype=np.int64)
+        lookup[self.ids] = np.arange(len(self.ids))
+        return lookup[game_ids]
+
+
+class _Frame:
+    # Instantané immuable des colonnes : une requête travaille sur le même état
+    # du début à la fin, pendant qu'un rafraîchissement en prépare un nouveau.
+    # Les tableaux dérivés (clés, totaux, tri par joueur) sont calculés à la demande.
+
+    def __init__(self, columns, games):
+        self.columns = columns
+        self.games = games
+        self.rows = len(columns["id_stat"])
+        self.high_water_mark = int(columns["id_stat"].max()) if self.rows else 0
+        self._derived = {}
+
+    def _memo(self, key, compute):
+        value = self._derived.get(key)
+        if value is None:
+            value = self._derived[key] = compute()
+        return value
+
+    def values(self, stat):
+        if stat == "points":
+            return self._memo("points", lambda: (
+                2 * self.columns["points_2pts_made"]
+                + 3 * self.columns["points_3pts_made"]
+                + self.columns["free_throws_made"]
+            ))
+        return self.columns[stat]
+
+    def keys(self, dimension):
+        if dimension == "player":
+            return self.columns["id_pla"]
+
+        def compute():
+            positions = self._memo("game_positions", lambda: self.games.positions(self.columns["id_gam"]))
+            keys = self.games.keys[dimension][positions]
+            keys[positions < 0] = -1
+            return keys
+
+        return self._memo(("keys", dimension), compute)
+
+    def player_order(self):
+        # Lignes triées par joueur : les matchs d'un joueur forment une tranche contiguë
+        def compute():
+            order = np.argsort(self.columns["id_pla"])
+            return order, self.columns["id_pla"][order]
+
+        return self._memo("player_order", compute)
+
+    def player_rows(self, player_id):
+        order, sorted_players = self.player_order()
+        start, stop = np.searchsorted(sorted_players, [player_id, player_id + 1])
+        return order[start:stop]
+
+    def player_averages(self, stat, min_games):
+        # Moyenne par match de chaque joueur (indexée par id_pla) et moyennes triées
+        # des joueurs ayant au moins min_games matchs
+        def compute():
+            players = self.columns["id_pla"]
+            games = np.bincount(players)
+            totals = np.bincount(players, weights=self.values(stat))
+            averages = np.divide(totals, games, out=np.zeros(len(games)), where=games > 0)
+            return games, averages, np.sort(averages[games >= max(min_games, 1)])
+
+        return self._memo(("averages", stat, min_games), compute)
+
+    def groups(self, dimension, stat, percentiles):
+        keys, values, players = self.keys(dimension), self.values(stat), self.columns["id_pla"]
+        present = keys >= 0
+        keys, values, players = keys[present], values[present], players[present]
+        if not len(keys):
+            return []
+        # Clés denses (code saison, ID_Lea, ID_Cha) : regroupement par bincount, sans tri
+        counts = np.bincount(keys)
+        groups = np.flatnonzero(counts)
+        # Une ligne par joueur et par match : moyenne et centiles portent sur les lignes
+        lines = counts[groups]
+        lookup = np.zeros(len(counts), dtype=np.int64)
+        lookup[groups] = np.arange(len(groups))
+        inverse = lookup[keys]
+        totals = np.bincount(inverse, weights=values, minlength=len(groups))
+        distinct_games = _distinct_per_group(inverse, self.columns["id_gam"][present], len(groups))
+        distinct_players = _distinct_per_group(inverse, players, len(groups))
+
+        # Statistiques entières et bornées : un histogramme cumulé par groupe donne la
+        # k-ième plus petite valeur (interpolation linéaire, comme numpy.percentile)
+        lowest = int(values.min())
+        span = int(values.max()) - lowest + 1
+        cumulative = np.bincount(
+            inverse * span + (values - lowest), minlength=len(groups) * span
+        ).reshape(len(groups), span).cumsum(axis=1)
+        fractions = np.array(percentiles, dtype=np.float64) / 100
+
+        summary = []
+        for index, group in enumerate(groups):
+            position = (lines[index] - 1) * fractions
+            low = np.searchsorted(cumulative[index], np.floor(position), side="right") + lowest
+            high = np.searchsorted(cumulative[index], np.ceil(position), side="right") + lowest
+            quantiles = low + (high - low) * (position - np.floor(position))
+            summary.append({
+                "key": self.decode(dimension, group),
+                "games": int(distinct_games[index]),
+                "stat_lines": int(lines[index]),
+                "players": int(distinct_players[index]),
+                "total": int(totals[index]),
+                "mean": round(float(totals[index] / lines[index]), 2),
+                **{f"p{percentile}": round(float(value), 2) for percentile, value in zip(percentiles, quantiles)},
+            })
+        return summary
+
+    def decode(self, dimension, key):
+        if dimension == "season":
+            return self.games.seasons[key]
+        return int(key)
+
+
+def _distinct_per_group(inverse, ids, group_count):
+    # Nombre d'identifiants distincts par groupe : couples (groupe, id) codés sur un
+    # seul entier, mémoire proportionnelle au nombre de lignes et non au plus grand id
+    width = int(ids.max()) + 1
+    pairs = np.unique(inverse * width + ids)
+    return np.bincount(pairs // width, minlength=group_count)
+
+
+def _empty_columns():
+    columns = {name: np.empty(0, dtype=np.int64) for name in ("id_stat", "id_gam", "id_pla")}
+    columns.update({name: np.empty(0, dtype=np.int32) for name in STAT_COLUMNS})
+    return columns
+
+
+class ColumnarStats:
+    # Copie en mémoire (tableaux NumPy, une colonne par statistique) de
+    # PLAYER_GAME_STATS et des clés de regroupement des matchs, pour les agrégats
+    # analytiques calculés sans requête SQL.
+    #
+    # Rafraîchissement au plus toutes les refresh_interval secondes, si Data_Version
+    # signale une écriture : seules les lignes au-delà du plus grand ID_Stat chargé
+    # sont lues (les statistiques sont ajoutées, rarement corrigées), la table Game
+    # (petite) est relue entière. Corrections et suppressions faites par l'application
+    # passent par invalidate() ; celles faites ailleurs, comme une ligne validée après
+    # une autre d'ID_Stat plus grand, sont rattrapées par le rechargement complet
+    # toutes les reload_interval secondes.
+    #
+    # Les chargements tournent dans un thread (start_sync) : une requête HTTP ne
+    # lit jamais PLAYER_GAME_STATS elle-même, elle sert l'instantané courant, ou
+    # rien tant que ready() est faux (premier chargement en cours).
+
+    def __init__(self, refresh_interval=5, reload_interval=3600, clock=time.monotonic):
+        self.refresh_interval = refresh_interval
+        self.reload_interval = reload_interval
+        self._clock = clock
+        # _lock : un seul chargement à la fois ; _state_lock : thread et invalidations,
+        # jamais tenu pendant un chargement (un commit ne l'attend pas)
+        self._lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._thread = None
+        self._frame = None
+        self._versions = None
+        self._stale = True
+        self._checked_at = None
+        self._loaded_at = None
+        self.full_loads = 0
+        self.incremental_loads = 0
+        self.invalidations = 0
+
+    def due(self):
+        return self._stale or self._checked_at is None \
+            or self._clock() - self._checked_at >= self.refresh_interval
+
+    def ready(self):
+        return self._frame is not None
+
+    def start_sync(self, run):
+        # run() appelle sync() avec sa propre connexion ; un seul thread à la fois
+        with self._state_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._thread = threading.Thread(target=run, name="columnar-sync", daemon=True)
+            self._thread.start()
+            return True
+
+    def wait(self, timeout=None):
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.ready()
+
+    def sync(self, connection, versions):
+        # versions : {table: version Data_Version} lues avant le chargement, une
+        # écriture concurrente sera donc vue au prochain passage
+        with self._lock:
+            if not self.due():
+                return
+            with self._state_lock:
+                invalidations = self.invalidations
+            now = self._clock()
+            frame = self._frame
+            if frame is None or self._stale or now - self._loaded_at >= self.reload_interval:
+                frame = _Frame(self._load_stats(connection, _empty_columns(), 0), self._load_games(connection))
+                self._loaded_at = now
+                self.full_loads += 1
+            else:
+                changed = {table for table in TABLES if versions.get(table) != self._versions.get(table)}
+                # Sans Data_Version (base ancienne), on vérifie à chaque passage
+                if not changed and None in versions.values():
+                    changed = set(TABLES)
+                if changed:
+                    games = self._load_games(connection) if "game" in changed else frame.games
+                    columns = frame.columns
+                    if "player_game_stats" in changed:
+                        columns = self._load_stats(connection, columns, frame.high_water_mark)
+                    if columns is not frame.columns or games is not frame.games:
+                        frame = _Frame(columns, games)
+                    self.incremental_loads += 1
+            self._frame = frame
+            self._versions = dict(versions)
+            with self._state_lock:
+                # Invalidation arrivée pendant le chargement : on recommencera
+                self._stale = self.invalidations != invalidations
+            self._checked_at = now
+
+    def _load_stats(self, connection, columns, after):
+        result = connection.execution_options(stream_results=True).execute(STATS_SQL, {"after": after})
+        chunks = [np.array(rows, dtype=np.int64) for rows in result.partitions(LOAD_CHUNK_ROWS)]
+        if not chunks:
+            return columns
+        block = np.concatenate(chunks)
+        names = ("id_stat", "id_gam", "id_pla", *STAT_COLUMNS)
+        return {
+            name: np.concatenate([columns[name], block[:, index].astype(columns[name].dtype)])
+            for index, name in enumerate(names)
+        }
+
+    def _load_games(self, connection):
+        return _Games(connection.execute(GAMES_SQL).all())
+
+    def group_summary(self, dimension, stat, percentiles=(50, 90)):
+        # Par groupe : matchs et joueurs distincts, lignes (joueur, match), total,
+        # moyenne et centiles des valeurs par ligne ; calculé une fois par instantané
+        frame = self._frame
+        return frame._memo(("groups", dimension, stat, tuple(percentiles)), lambda: frame.groups(dimension, stat, percentiles))
+
+    def player_splits(self, player_id, dimension="season"):
+        # Totaux et moyennes d'un joueur par saison (ou ligue, championnat)
+        frame = self._frame
+        rows = frame.player_rows(player_id)
+        keys = frame.keys(dimension)[rows]
+        rows, keys = rows[keys >= 0], keys[keys >= 0]
+        if not len(rows):
+            return []
+        # Clé primaire (ID_Gam, ID_Pla) : pour un joueur, une ligne = un match
+        groups, inverse, games = np.unique(keys, return_inverse=True, return_counts=True)
+        totals = {
+            stat: np.bincount(inverse, weights=frame.values(stat)[rows], minlength=len(groups))
+            for stat in ("points", "rebounds", "assists", "blocks")
+        }
+        return [
+            {
+                "key": frame.decode(dimension, group),
+                "games": int(games[index]),
+                **{stat: int(totals[stat][index]) for stat in totals},
+                "ppg": round(float(totals["points"][index] / games[index]), 1),
+                "rpg": round(float(totals["rebounds"][index] / games[index]), 1),
+                "apg": round(float(totals["assists"][index] / games[index]), 1),
+            }
+            for index, group in enumerate(groups)
+        ]
+
+    def player_ranking(self, player_id, stat, min_games=1):
+        # Rang et centile de la moyenne par match du joueur parmi les joueurs ayant
+        # au moins min_games matchs ; None si le joueur lui-même n'en a pas assez
+        games, averages, qualified = self._frame.player_averages(stat, min_games)
+        if player_id >= len(games) or games[player_id] < max(min_games, 1):
+            return None
+        average = averages[player_id]
+        return {
+            "average": round(float(average), 1),
+            "rank": int(len(qualified) - np.searchsorted(qualified, average, side="right")) + 1,
+            "players": len(qualified),
+            "percentile": round(float(np.searchsorted(qualified, average, side="right") * 100 / len(qualified)), 1),
+        }
+
+    def distribution(self, stat, percentiles=(10, 25, 50, 75, 90), min_games=1):
+        # Centiles des moyennes par match des joueurs ayant au moins min_games matchs
+        _, _, qualified = self._frame.player_averages(stat, min_games)
+        if not len(qualified):
+            return {}
+        return {f"p{p}": round(float(value), 2) for p, value in zip(percentiles, np.percentile(qualified, percentiles))}
+
+    def invalidate(self):
+        # Écriture non incrémentale (correction, suppression) : rechargement complet
+        with self._state_lock:
+            self._stale = True
+            self.invalidations += 1
+
+    def stats(self):
+        frame = self._frame
+        return {
+            "rows": frame.rows if frame else 0,
+            "high_water_mark": frame.high_water_mark if frame else None,
+            "bytes": sum(column.nbytes for column in frame.columns.values()) if frame else 0,
+            "age_seconds": round(self._clock() - self._loaded_at, 1) if self._loaded_at is not None else None,
+            "refresh_interval": self.refresh_interval,
+            "reload_interval": self.reload_interval,
+            "full_loads": self.full_loads,
+            "incremental_loads": self.incremental_loads,
+            "invalidations": self.invalidations,
+        }
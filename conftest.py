@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import text
+
+from app import create_app, db
+
+
+@pytest.fixture
+def app():
+    # Base SQLite en mémoire, schéma créé par create_app() ; une par test
+    app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://", "TESTING": True})
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    client.post("/login", data={"username": "admin", "password": "admin123"})
+    return client
+
+
+@pytest.fixture
+def execute(app):
+    def run(statement, **params):
+        result = db.session.execute(text(statement), params)
+        db.session.commit()
+        return result
+
+    return run
+
+
+@pytest.fixture
+def add_player(execute):
+    def add(id_pla, name=None, height=1.95):
+        execute(
+            "INSERT INTO Player (ID_Pla, Player_ID, Name, Date_of_birth, Height) "
+            "VALUES (:id, :code, :name, '2000-01-01', :height)",
+            id=id_pla, code=f"P{id_pla}", name=name or f"Player {id_pla}", height=height,
+        )
+        return id_pla
+
+    return add
+
+
+@pytest.fixture
+def add_game(execute):
+    def add(id_gam, season="2023-2024", id_lea=None, id_cha=None, game_date="2024-01-01"):
+        execute(
+            "INSERT INTO Game (ID_Gam, Game_ID, Game_date, Location, Game_type, Season, ID_Lea, ID_Cha) "
+            "VALUES (:id, :code, :game_date, 'Paris', 'League', :season, :id_lea, :id_cha)",
+            id=id_gam, code=f"G{id_gam}", game_date=game_date, season=season, id_lea=id_lea, id_cha=id_cha,
+        )
+        return id_gam
+
+    return add
+
+
+@pytest.fixture
+def add_stats(execute):
+    def add(id_gam, id_pla, made_2=0, made_3=0, free_throws=0, rebounds=0, assists=0, blocks=0):
+        execute(
+            "INSERT INTO PLAYER_GAME_STATS (ID_Gam, ID_Pla, Points_2pts_made, Points_2pts_attempted, "
+            "Points_3pts_made, Points_3pts_attempted, Free_throws_made, Free_throws_attempted, "
+            "Rebounds, Assists, Blocks) "
+            "VALUES (:gam, :pla, :made_2, :made_2, :made_3, :made_3, :ft, :ft, :reb, :ast, :blk)",
+            gam=id_gam, pla=id_pla, made_2=made_2, made_3=made_3, ft=free_throws,
+            reb=rebounds, ast=assists, blk=blocks,
+        )
+
+    return add
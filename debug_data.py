@@ -1,7 +1,7 @@
-from app import app, db, Player, NationalTeam, Club
+from app import create_app, db, Player, NationalTeam, Club
 from sqlalchemy import func
 
-with app.app_context():
+with create_app().app_context():
     print("--- Player Citizenship Distribution ---")
     citizenship_data = db.session.query(Player.citizenship, func.count(Player.id_pla)).group_by(Player.citizenship).all()
     total_players = 0
@@ -0,0 +1,104 @@
+import os
+import re
+import sqlite3
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+
+from metrics import instrumented_pool
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_FILES = {
+    "postgresql": os.path.join(BASE_DIR, "CreateTables.sql"),
+    "sqlite": os.path.join(BASE_DIR, "CreateTables.sqlite.sql"),
+}
+
+WORD_SPLIT = re.compile(r"[^\w]+")
+
+# Tables versionnées dans Data_Version : même liste que la boucle DO de CreateTables.sql
+# (vérifié par test_schema.py). SQLite n'a pas de SQL dynamique : les lignes et les
+# triggers sont générés par sqlite_data_version_script() plutôt que recopiés à la main.
+VERSIONED_TABLES = (
+    "league", "championship", "clubs", "sponsor", "national_team", "player",
+    "game", "game_participant", "player_game_stats", "has_sponsor_club",
+    "has_sponsor_team", "member_of", "participates_in", "participates_in_league",
+)
+
+SQLITE_DATA_VERSION_TRIGGER = """
+CREATE TRIGGER TRG_{table}_Data_Version_{event_name} AFTER {event} ON {table}
+BEGIN
+    INSERT INTO Data_Version (Table_name, Version, Changed_at)
+    VALUES ('{table}', 1, strftime('%Y-%m-%d %H:%M:%f', 'now'))
+    ON CONFLICT (Table_name) DO UPDATE SET
+        Version = Version + 1,
+        Changed_at = excluded.Changed_at;
+END;
+"""
+
+
+def engine_options(database_url, pool_size=5, max_overflow=10, pre_ping=False, recycle=-1, engine_label="primary"):
+    # Options du moteur selon l'URL : une base SQLite en mémoire n'existe que dans
+    # sa connexion, qui doit donc être unique et partagée entre les threads.
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+    options = {
+        # engine_label : étiquette "engine" des métriques du pool (primary, replica)
+        "poolclass": instrumented_pool(engine_label),
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_pre_ping": pre_ping,
+        "pool_recycle": recycle,
+    }
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+    return options
+
+
+def _trigrams(word):
+    # Comme pg_trgm : mot en minuscules, complété par deux espaces devant et un derrière
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def word_similarity(query, text):
+    # Équivalent approché de pg_trgm.word_similarity(query, text) : part des trigrammes
+    # de la requête retrouvés dans le mot du texte qui lui ressemble le plus
+    if query is None or text is None:
+        return None
+    query_trigrams = set()
+    for word in WORD_SPLIT.split(query.lower()):
+        if word:
+            query_trigrams |= _trigrams(word)
+    if not query_trigrams:
+        return 0.0
+    best = 0
+    for word in WORD_SPLIT.split(text.lower()):
+        if word:
+            best = max(best, len(query_trigrams & _trigrams(word)))
+    return best / len(query_trigrams)
+
+
+def sqlite_data_version_script():
+    # Complément de CreateTables.sqlite.sql : une ligne et trois triggers (par ligne,
+    # faute de triggers par instruction) pour chaque table de VERSIONED_TABLES
+    rows = ",\n".join(f"    ('{table}')" for table in VERSIONED_TABLES)
+    triggers = "".join(
+        SQLITE_DATA_VERSION_TRIGGER.format(table=table, event=event, event_name=event.title())
+        for table in VERSIONED_TABLES
+        for event in ("INSERT", "UPDATE", "DELETE")
+    )
+    return f"\nINSERT INTO Data_Version (Table_name) VALUES\n{rows};\n{triggers}"
+
+
+def configure_sqlite_connection(dbapi_connection):
+    # Fonctions et réglages attendus par l'application sur chaque connexion SQLite
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys = ON")
+    cursor.execute("PRAGMA journal_mode = WAL")
+    cursor.close()
+    dbapi_connection.create_function("word_similarity", 2, word_similarity, deterministic=True)
+
+
+def is_sqlite_connection(dbapi_connection):
+    return isinstance(dbapi_connection, sqlite3.Connection)
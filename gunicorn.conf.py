@@ -0,0 +1,38 @@
+import multiprocessing
+import os
+import shutil
+
+# Serveur de production : plusieurs processus, application chargée une fois dans
+# le maître (preload) puis partagée par fork.
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+worker_class = "gthread"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+accesslog = "-"
+
+# Métriques Prometheus multi-processus : dossier vidé à chaque démarrage. Fait ici,
+# à la lecture de la configuration, car le preload importe l'application (et crée
+# les métriques) avant le premier hook.
+if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+    shutil.rmtree(os.environ["PROMETHEUS_MULTIPROC_DIR"], ignore_errors=True)
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+
+def post_fork(server, worker):
+    # Connexions ouvertes par le maître (preload) : jamais réutilisées par un worker.
+    # close=False : on les abandonne sans les fermer, elles restent au maître.
+    from app import db
+    from wsgi import app
+
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,329 @@
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from urllib.parse import quote, urlencode, urlsplit
+
+# Comptes de démonstration (voir USERS dans app.py), répartis entre les utilisateurs virtuels
+ACCOUNTS = {
+    "admin": "admin123",
+    "staff": "staff123",
+    "viewer": "viewer123",
+}
+
+REQUEST_KINDS = ("dashboard", "search", "autocomplete", "profile", "games", "box_score")
+DEFAULT_MIX = "dashboard=2,search=3,profile=3,games=1,box_score=2"
+
+
+class HttpError(Exception):
+    pass
+
+
+class HttpConnection:
+    # Client HTTP/1.1 minimal sur asyncio : connexion persistante (keep-alive),
+    # corps par Content-Length ou chunked, cookies de session conservés.
+
+    def __init__(self, host, port, timeout):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.cookies = {}
+        self.reader = None
+        self.writer = None
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+        self.reader = self.writer = None
+
+    async def request(self, method, path, form=None):
+        # Une connexion réutilisée a pu être fermée par le serveur : un seul nouvel essai
+        for attempt in (1, 2):
+            reused = self.writer is not None
+            try:
+                return await asyncio.wait_for(self._exchange(method, path, form), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self.close()
+                if not reused or attempt == 2:
+                    raise
+            except BaseException:
+                await self.close()
+                raise
+
+    async def _exchange(self, method, path, form):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+        body = urlencode(form).encode() if form is not None else b""
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", "Connection: keep-alive"]
+        if self.cookies:
+            lines.append("Cookie: " + "; ".join(f"{name}={value}" for name, value in self.cookies.items()))
+        if form is not None:
+            lines.append("Content-Type: application/x-www-form-urlencoded")
+        if form is not None or method not in ("GET", "HEAD"):
+            lines.append(f"Content-Length: {len(body)}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed by server")
+        version, status = status_line.decode("latin-1").split(" ", 2)[:2]
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name, value = name.strip().lower(), value.strip()
+            if name == "set-cookie":
+                self._store_cookie(value)
+            else:
+                headers[name] = value
+        status = int(status)
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            payload = b""
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            payload = await self._read_chunked()
+        elif "content-length" in headers:
+            payload = await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            # Ni longueur ni chunked : le corps s'arrête à la fermeture
+            payload = await self.reader.read()
+            headers["connection"] = "close"
+
+        connection = headers.get("connection", "").lower()
+        if connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive"):
+            await self.close()
+        return status, headers, payload
+
+    async def _read_chunked(self):
+        chunks = []
+        while True:
+            size_line = await self.reader.readline()
+            size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                # Trailers éventuels, jusqu'à la ligne vide
+                while (await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+    def _store_cookie(self, header):
+        pair = header.split(";", 1)[0]
+        name, _, value = pair.partition("=")
+        attributes = header.lower()
+        if "max-age=0" in attributes or "expires=thu, 01 jan 1970" in attributes:
+            self.cookies.pop(name.strip(), None)
+        else:
+            self.cookies[name.strip()] = value.strip()
+
+
+async def login(connection, username):
+    status, headers, _ = await connection.request(
+        "POST", "/login", form={"username": username, "password": ACCOUNTS[username]}
+    )
+    if status != 302 or headers.get("location", "").endswith("/login"):
+        raise HttpError(f"login failed for {username} (HTTP {status})")
+
+
+async def discover_targets(host, port, timeout):
+    # Identifiants réels pour les profils / box scores et termes de recherche
+    connection = HttpConnection(host, port, timeout)
+    try:
+        await login(connection, "viewer")
+        responses = [
+            await connection.request("GET", path) for path in ("/players?format=json", "/games?format=json")
+        ]
+    finally:
+        await connection.close()
+    for path, (status, _, _) in zip(("/players", "/games"), responses):
+        if status != 200:
+            raise HttpError(f"GET {path}?format=json returned HTTP {status}")
+    players = json.loads(responses[0][2])["players"]
+    games = json.loads(responses[1][2])["games"]
+    if not players or not games:
+        raise HttpError("the database has no players or no games: run seed_db.py first")
+    return {
+        "player_ids": [player["id_pla"] for player in players],
+        "game_ids": [game["id_gam"] for game in games],
+        "search_terms": sorted({player["name"].split()[-1][:4] for player in players if player["name"]}),
+    }
+
+
+def build_request(kind, targets, rng):
+    if kind == "dashboard":
+        # La page elle-même ne lit rien : les données viennent de /api/dashboard
+        return "/api/dashboard"
+    if kind == "search":
+        return "/players?q=" + quote(rng.choice(targets["search_terms"]))
+    if kind == "autocomplete":
+        return "/api/players/autocomplete?q=" + quote(rng.choice(targets["search_terms"]))
+    if kind == "profile":
+        return f"/players/{rng.choice(targets['player_ids'])}"
+    if kind == "games":
+        return "/games"
+    if kind == "box_score":
+        return f"/games/{rng.choice(targets['game_ids'])}"
+    raise ValueError(f"unknown request kind: {kind}")
+
+
+def parse_mix(value):
+    mix = {}
+    for item in value.split(","):
+        kind, _, weight = item.partition("=")
+        if kind.strip() not in REQUEST_KINDS:
+            raise ValueError(f"unknown request kind: {kind.strip()}")
+        mix[kind.strip()] = float(weight or 1)
+    return mix
+
+
+async def virtual_user(index, host, port, args, targets, mix, deadline, measure_from, samples):
+    rng = random.Random(args.seed * 1000 + index)
+    username = args.users[index % len(args.users)]
+    connection = HttpConnection(host, port, args.timeout)
+    kinds, weights = list(mix), list(mix.values())
+    try:
+        await login(connection, username)
+        while time.monotonic() < deadline:
+            kind = rng.choices(kinds, weights)[0]
+            path = build_request(kind, targets, rng)
+            started = time.monotonic()
+            try:
+                status, headers, _ = await connection.request("GET", path)
+                # Une redirection vers /login signifie une session perdue
+                ok = status < 400 and not headers.get("location", "").endswith("/login")
+                error = None if ok else f"HTTP {status}"
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as exc:
+                error = type(exc).__name__
+            if started >= measure_from:
+                samples.append((kind, time.monotonic() - started, error))
+    finally:
+        await connection.close()
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    return sorted_values[max(1, math.ceil(fraction * len(sorted_values))) - 1]
+
+
+def summarize(samples, elapsed):
+    def stats(rows):
+        latencies = sorted(latency * 1000 for _, latency, _ in rows)
+        errors = sum(1 for _, _, error in rows if error)
+        return {
+            "requests": len(rows),
+            "throughput": round(len(rows) / elapsed, 1) if elapsed else None,
+            "error_rate": round(errors / len(rows), 4) if rows else None,
+            "p50_ms": round(percentile(latencies, 0.50), 1) if latencies else None,
+            "p90_ms": round(percentile(latencies, 0.90), 1) if latencies else None,
+            "p99_ms": round(percentile(latencies, 0.99), 1) if latencies else None,
+            "max_ms": round(latencies[-1], 1) if latencies else None,
+        }
+
+    errors = {}
+    for _, _, error in samples:
+        if error:
+            errors[error] = errors.get(error, 0) + 1
+    return {
+        "total": stats(samples),
+        "by_kind": {
+            kind: stats([row for row in samples if row[0] == kind])
+            for kind in sorted({row[0] for row in samples})
+        },
+        "errors": errors,
+    }
+
+
+async def run_step(concurrency, host, port, args, targets, mix):
+    samples = []
+    started = time.monotonic()
+    measure_from = started + args.warmup
+    deadline = measure_from + args.duration
+    await asyncio.gather(*(
+        virtual_user(index, host, port, args, targets, mix, deadline, measure_from, samples)
+        for index in range(concurrency)
+    ))
+    return summarize(samples, time.monotonic() - measure_from)
+
+
+def print_step(concurrency, result):
+    total = result["total"]
+    print(
+        f"concurrency {concurrency:>4}: {total['requests']:>7} req  {total['throughput'] or 0:>8.1f} req/s  "
+        f"p50 {total['p50_ms'] or 0:>7.1f} ms  p90 {total['p90_ms'] or 0:>7.1f} ms  "
+        f"p99 {total['p99_ms'] or 0:>7.1f} ms  errors {100 * (total['error_rate'] or 0):.2f}%",
+        flush=True,
+    )
+    for kind, stats in result["by_kind"].items():
+        print(
+            f"    {kind:<13} {stats['requests']:>7} req  p50 {stats['p50_ms']:>7.1f} ms  "
+            f"p99 {stats['p99_ms']:>7.1f} ms  errors {100 * stats['error_rate']:.2f}%"
+        )
+    for error, count in result["errors"].items():
+        print(f"    ! {error}: {count}")
+
+
+async def main(args):
+    url = urlsplit(args.url)
+    if url.scheme != "http":
+        raise SystemExit("only plain http:// URLs are supported")
+    host, port = url.hostname, url.port or 80
+    mix = parse_mix(args.mix)
+
+    targets = await discover_targets(host, port, args.timeout)
+    print(
+        f"Target {args.url}: {len(targets['player_ids'])} players, {len(targets['game_ids'])} games, "
+        f"mix {args.mix}, users {','.join(args.users)}"
+    )
+    results = {}
+    for concurrency in args.concurrency:
+        results[concurrency] = await run_step(concurrency, host, port, args, targets, mix)
+        print_step(concurrency, results[concurrency])
+
+    if len(results) > 1:
+        # Saturation : au-delà du pic de débit, ajouter des clients n'augmente que la latence
+        peak = max(results, key=lambda level: results[level]["total"]["throughput"] or 0)
+        print(f"Peak throughput {results[peak]['total']['throughput']} req/s at concurrency {peak}.")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"url": args.url, "mix": args.mix, "steps": results}, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a request mix against a running instance.")
+    parser.add_argument("--url", default="http://127.0.0.1:5000", help="Base URL (default: http://127.0.0.1:5000)")
+    parser.add_argument(
+        "--concurrency", default="10",
+        help="Virtual users; a comma-separated list runs one step per level, e.g. 1,5,10,20,50 (default: 10)",
+    )
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds per step (default: 30)")
+    parser.add_argument("--warmup", type=float, default=2, help="Unmeasured seconds per step (default: 2)")
+    parser.add_argument(
+        "--mix", default=DEFAULT_MIX,
+        help=f"Weighted request kinds among {', '.join(REQUEST_KINDS)} (default: {DEFAULT_MIX})",
+    )
+    parser.add_argument(
+        "--users", default="admin,staff,viewer",
+        help="Demo accounts assigned round-robin to virtual users (default: admin,staff,viewer)",
+    )
+    parser.add_argument("--timeout", type=float, default=30, help="Per-request timeout in seconds (default: 30)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the request sequence (default: 1)")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+    args.concurrency = [int(value) for value in args.concurrency.split(",")]
+    args.users = [user.strip() for user in args.users.split(",")]
+    unknown = set(args.users) - set(ACCOUNTS)
+    if unknown:
+        parser.error(f"unknown demo account(s): {', '.join(sorted(unknown))}")
+    asyncio.run(main(args))
@@ -0,0 +1,90 @@
+import os
+import time
+
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry,
+                               Counter, Gauge, Histogram, generate_latest,
+                               multiprocess)
+from sqlalchemy.pool import QueuePool
+
+# Métriques Prometheus de l'application. Avec plusieurs processus (gunicorn),
+# définir PROMETHEUS_MULTIPROC_DIR (dossier vide, propre à l'instance) avant le
+# démarrage : chaque processus écrit ses valeurs dans ce dossier et /metrics les
+# agrège.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SQL_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1, 5)
+
+HTTP_REQUESTS = Counter(
+    "bd_http_requests_total", "Requêtes HTTP traitées.", ["endpoint", "method", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "bd_http_request_duration_seconds", "Durée de traitement des requêtes HTTP.",
+    ["endpoint"], buckets=LATENCY_BUCKETS,
+)
+SQL_STATEMENTS = Counter(
+    "bd_sql_statements_total", "Instructions SQL exécutées, par endpoint.", ["endpoint"]
+)
+SQL_TIME = Counter(
+    "bd_sql_seconds_total", "Temps cumulé passé en base, par endpoint.", ["endpoint"]
+)
+SQL_DURATION = Histogram(
+    "bd_sql_statement_duration_seconds", "Durée de chaque instruction SQL.", buckets=SQL_BUCKETS
+)
+# Métriques de pool par moteur (engine="primary" ou "replica") : chaque base a son pool
+POOL_CHECKOUTS = Counter("bd_db_pool_checkouts_total", "Connexions empruntées au pool.", ["engine"])
+POOL_WAIT = Histogram(
+    "bd_db_pool_wait_seconds", "Attente pour obtenir une connexion du pool.", ["engine"],
+    buckets=SQL_BUCKETS,
+)
+POOL_CHECKED_OUT = Gauge(
+    "bd_db_pool_checked_out", "Connexions actuellement empruntées.", ["engine"],
+    multiprocess_mode="livesum",
+)
+POOL_OVERFLOW = Gauge(
+    "bd_db_pool_overflow", "Connexions ouvertes au-delà de pool_size.", ["engine"],
+    multiprocess_mode="livesum",
+)
+
+
+class InstrumentedQueuePool(QueuePool):
+    # QueuePool qui mesure l'attente d'une connexion et l'usage du débordement.
+    # SQLAlchemy instancie la classe lui-même : le moteur est porté par une
+    # sous-classe (instrumented_pool), conservée par Pool.recreate().
+    engine_label = "primary"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        connection = super()._do_get()
+        POOL_WAIT.labels(self.engine_label).observe(time.perf_counter() - started)
+        POOL_CHECKOUTS.labels(self.engine_label).inc()
+        self._report()
+        return connection
+
+    def _do_return_conn(self, record):
+        super()._do_return_conn(record)
+        self._report()
+
+    def _report(self):
+        POOL_CHECKED_OUT.labels(self.engine_label).set(self.checkedout())
+        POOL_OVERFLOW.labels(self.engine_label).set(max(self.overflow(), 0))
+
+
+_POOL_CLASSES = {}
+
+
+def instrumented_pool(engine_label):
+    # Une classe par moteur, créée une fois
+    if engine_label not in _POOL_CLASSES:
+        _POOL_CLASSES[engine_label] = type(
+            f"InstrumentedQueuePool_{engine_label}", (InstrumentedQueuePool,), {"engine_label": engine_label}
+        )
+    return _POOL_CLASSES[engine_label]
+
+
+def render_metrics():
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
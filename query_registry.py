@@ -0,0 +1,246 @@
+import glob
+import os
+import re
+import threading
+import time
+
+VIEW_PATTERN = re.compile(r'CREATE\s+(?:OR\s+REPLACE\s+)?VIEW\s+(\w+)', re.IGNORECASE)
+# Commentaires SQL en tête de fichier, ignorés pour classer la requête
+LEADING_COMMENTS = re.compile(r'^(?:\s+|--[^\n]*\n?|/\*.*?\*/)*', re.DOTALL)
+ROW_QUERY_PATTERN = re.compile(r'(?:SELECT|WITH|VALUES|TABLE)\b', re.IGNORECASE)
+# Analyse des relations lues (sert à retrouver les versions de données) : littéraux
+# et commentaires retirés, puis découpage en identifiants et ponctuation
+STRINGS_AND_COMMENTS = re.compile(r"'(?:[^']|'')*'|--[^\n]*|/\*.*?\*/", re.DOTALL)
+TOKEN = re.compile(r'"(?:[^"]|"")*"|[A-Za-z_][\w$]*|\d+(?:\.\d+)?|\S')
+# Mots qui suivent une relation : ce n'est pas un alias
+NOT_ALIAS = {
+    "where", "group", "order", "having", "limit", "offset", "union", "intersect", "except",
+    "window", "on", "using", "join", "inner", "left", "right", "full", "cross", "natural",
+    "fetch", "for", "returning", "set", "values", "select", "into", "tablesample",
+}
+# Mots qui terminent une liste FROM
+FROM_END = {
+    "where", "group", "order", "having", "limit", "offset", "union", "intersect", "except",
+    "window", "fetch", "for", "returning", ";",
+}
+
+DEFAULT_PATTERNS = ("req*.sql", "SqlView/*.sql", "SqlMatView/*.sql")
+
+
+def is_row_query(sql_query):
+    # Seules ces requêtes peuvent passer par un curseur serveur (DECLARE ... CURSOR)
+    return bool(ROW_QUERY_PATTERN.match(sql_query, LEADING_COMMENTS.match(sql_query).end()))
+
+
+def _identifier(token):
+    if token.startswith('"'):
+        return token[1:-1].replace('""', '"').lower()
+    if token[0].isalpha() or token[0] == "_":
+        return token.lower()
+    return None
+
+
+def _skip_parentheses(tokens, index):
+    # tokens[index] == "(" : position après la parenthèse fermante correspondante
+    depth = 0
+    for position in range(index, len(tokens)):
+        if tokens[position] == "(":
+            depth += 1
+        elif tokens[position] == ")":
+            depth -= 1
+            if depth == 0:
+                return position + 1
+    raise ValueError("parenthèses non fermées")
+
+
+def _from_item(tokens, index, relations):
+    # Une entrée de FROM / JOIN / liste FROM a, b : relation (éventuellement qualifiée
+    # par son schéma) et son alias. Une sous-requête entre parenthèses est laissée à
+    # la boucle principale, qui l'analyse comme le reste.
+    if index < len(tokens) and tokens[index] == "(":
+        return index
+    name = _identifier(tokens[index]) if index < len(tokens) else None
+    if name is None:
+        raise ValueError("relation attendue")
+    index += 1
+    while index + 1 < len(tokens) and tokens[index] == "." and _identifier(tokens[index + 1]):
+        name = _identifier(tokens[index + 1])
+        index += 2
+    if index < len(tokens) and tokens[index] == "(":
+        # Fonction renvoyant des lignes (generate_series, ...) : relations inconnues
+        raise ValueError("fonction dans FROM")
+    relations.add(name)
+    if index < len(tokens) and tokens[index].lower() == "as":
+        index += 1
+    if index < len(tokens) and _identifier(tokens[index]) and tokens[index].lower() not in NOT_ALIAS:
+        index += 1
+    return index
+
+
+def _cte_names(tokens, index):
+    # tokens[index] == WITH : noms des requêtes nommées, qui ne sont pas des tables
+    names = set()
+    index += 1
+    if index < len(tokens) and tokens[index].lower() == "recursive":
+        index += 1
+    while index < len(tokens) and _identifier(tokens[index]):
+        names.add(_identifier(tokens[index]))
+        index += 1
+        if index < len(tokens) and tokens[index] == "(":
+            index = _skip_parentheses(tokens, index)
+        while index < len(tokens) and tokens[index].lower() in ("as", "not", "materialized"):
+            index += 1
+        if index >= len(tokens) or tokens[index] != "(":
+            break
+        index = _skip_parentheses(tokens, index)
+        if index >= len(tokens) or tokens[index] != ",":
+            break
+        index += 1
+    return names
+
+
+def referenced_tables(sql_query):
+    # Relations lues par la requête (FROM, JOIN, listes FROM a, b, y compris après
+    # une condition ON), sans les CTE ; None si l'analyse n'est pas sûre : le
+    # résultat ne doit alors pas être mis en cache
+    tokens = TOKEN.findall(STRINGS_AND_COMMENTS.sub(" ", sql_query))
+    relations, ctes = set(), set()
+    # Profondeurs de parenthèses où une liste FROM est ouverte : une virgule y
+    # introduit une nouvelle relation
+    open_from = set()
+    depth = index = 0
+    try:
+        while index < len(tokens):
+            token, keyword = tokens[index], tokens[index].lower()
+            if token == "(":
+                depth += 1
+            elif token == ")":
+                open_from.discard(depth)
+                depth -= 1
+                if depth < 0:
+                    raise ValueError("parenthèse fermante en trop")
+            elif keyword == "with":
+                ctes |= _cte_names(tokens, index)
+            elif keyword in ("from", "join") or (token == "," and depth in open_from):
+                if keyword == "from":
+                    open_from.add(depth)
+                index = _from_item(tokens, index + 1, relations)
+                continue
+            elif keyword in FROM_END:
+                open_from.discard(depth)
+            index += 1
+        if depth:
+            raise ValueError("parenthèses non fermées")
+    except ValueError:
+        return None
+    return frozenset(relations - ctes)
+
+
+def classify(sql_query):
+    view_match = VIEW_PATTERN.search(sql_query)
+    if view_match:
+        return "view", view_match.group(1)
+    if is_row_query(sql_query):
+        return "select", None
+    return "dml", None
+
+
+class RegistryQuery:
+    def __init__(self, key, path, sql, mtime):
+        self.key = key
+        self.path = path
+        self.sql = sql
+        self.mtime = mtime
+        self.kind, self.view_name = classify(sql)
+        # frozenset des relations lues, None si l'analyse n'est pas sûre
+        self.tables = referenced_tables(sql)
+
+    @property
+    def run_sql(self):
+        # Ce qu'on exécute pour afficher le résultat : une vue installée est seulement interrogée
+        if self.kind == "view":
+            return f"SELECT * FROM {self.view_name}"
+        return self.sql
+
+    @property
+    def returns_rows(self):
+        return self.kind in ("view", "select")
+
+
+class QueryRegistry:
+    # Requêtes prédéfinies (req*.sql, SqlView/*.sql, SqlMatView/*.sql) lues une
+    # fois, relues seulement si un fichier ou un dossier surveillé change (mtime),
+    # et au plus une vérification toutes les `check_interval` secondes.
+
+    def __init__(self, root, patterns=DEFAULT_PATTERNS, check_interval=2.0):
+        self.root = root
+        self.patterns = patterns
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._queries = {}
+        self._signature = None
+        self._checked_at = 0.0
+        # (clé, mtime) des vues déjà installées par ce processus
+        self._installed = set()
+
+    def _watched_paths(self):
+        # Les dossiers détectent les fichiers ajoutés / supprimés, les fichiers leurs modifications
+        directories = {os.path.dirname(os.path.join(self.root, pattern)) for pattern in self.patterns}
+        return sorted(directories) + sorted(query.path for query in self._queries.values())
+
+    def _current_signature(self):
+        signature = []
+        for path in self._watched_paths():
+            try:
+                signature.append((path, os.stat(path).st_mtime_ns))
+            except OSError:
+                signature.append((path, None))
+        return tuple(signature)
+
+    def load(self):
+        queries = {}
+        paths = sorted(
+            path for pattern in self.patterns for path in glob.glob(os.path.join(self.root, pattern))
+        )
+        for path in paths:
+            # Extraire le nom (ex: "req1" ou "view1")
+            key = os.path.splitext(os.path.basename(path))[0]
+            try:
+                with open(path, "r", encoding="utf-8-sig") as f:
+                    queries[key] = RegistryQuery(key, path, f.read().strip(), os.stat(path).st_mtime_ns)
+            except OSError:
+                continue
+        with self._lock:
+            self._queries = queries
+            self._signature = self._current_signature()
+            self._checked_at = time.monotonic()
+
+    def refresh_if_changed(self):
+        with self._lock:
+            if time.monotonic() - self._checked_at < self.check_interval:
+                return False
+            self._checked_at = time.monotonic()
+            changed = self._current_signature() != self._signature
+        if changed:
+            self.load()
+        return changed
+
+    def queries(self):
+        self.refresh_if_changed()
+        return dict(self._queries)
+
+    def get(self, key):
+        return self.queries().get(key)
+
+    def needs_install(self, query):
+        return query.kind == "view" and (query.key, query.mtime) not in self._installed
+
+    def forget_installed(self, query):
+        # La vue a pu être supprimée entre-temps (DeleteTables.sql) : on la recréera
+        with self._lock:
+            self._installed.discard((query.key, query.mtime))
+
+    def mark_installed(self, query):
+        with self._lock:
+            self._installed = {item for item in self._installed if item[0] != query.key}
+            self._installed.add((query.key, query.mtime))
@@ -2,7 +2,7 @@ SELECT
     p.name,
     pgs.free_throws_made,
     pgs.free_throws_attempted,
-    ROUND((pgs.free_throws_made::numeric / pgs.free_throws_attempted) * 100, 2) AS free_throw_percentage
+    ROUND(pgs.free_throws_made * 100.0 / pgs.free_throws_attempted, 2) AS free_throw_percentage
 FROM player AS p
 JOIN player_game_stats AS pgs ON p.id_pla = pgs.id_pla
 JOIN game AS g ON pgs.id_gam = g.id_gam
@@ -31,7 +31,7 @@ WITH current_season AS (
         total_3pts_made,
         total_3pts_attempted,
         CASE
-            WHEN total_3pts_attempted > 0 THEN total_3pts_made::numeric / total_3pts_attempted
+            WHEN total_3pts_attempted > 0 THEN total_3pts_made * 1.0 / total_3pts_attempted
             ELSE NULL
         END AS three_pt_percentage
     FROM player_totals
@@ -3,7 +3,7 @@ WITH target_club AS (
 )
 SELECT
     p.name,
-    AVG(pgs.assists)::numeric(10,2) AS average_assists_per_game
+    ROUND(AVG(pgs.assists), 2) AS average_assists_per_game
 FROM player AS p
 JOIN target_club AS tc ON p.current_club_id = tc.id_clu
 JOIN player_game_stats AS pgs ON p.id_pla = pgs.id_pla
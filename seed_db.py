@@ -1,14 +1,33 @@
+import argparse
+import io
+import multiprocessing
 import os
 import random
+import re
+import time
 from datetime import date, timedelta
 
 import psycopg2
 from faker import Faker
 
-# Initialize Faker
-fake = Faker(['en_US', 'fr_FR', 'es_ES', 'it_IT'])
+CREATE_TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CreateTables.sql")
 
-def get_connection():
+# Volume généré par unité d'échelle (--scale) : une unité = une ligue complète
+LEAGUES_PER_SCALE = 2
+CLUBS_PER_LEAGUE = 8
+PLAYERS_PER_CLUB = 12
+PLAYERS_PER_GAME = 10  # joueurs alignés par club et par match
+# Aller-retour entre tous les clubs + une finale par saison
+GAMES_PER_LEAGUE_SEASON = CLUBS_PER_LEAGUE * (CLUBS_PER_LEAGUE - 1) + 1
+STATS_PER_GAME = 2 * PLAYERS_PER_GAME
+COPY_BATCH_ROWS = 50000
+# Saisons de remplissage : la plus récente reste antérieure aux données curées (2024/2025)
+LAST_FILLER_SEASON_START = 2023
+
+def get_connection(dsn=None):
+    # dsn (URI libpq) prime sur les variables DB_* : bench.py charge ainsi la base qu'il mesure
+    if dsn:
+        return psycopg2.connect(dsn)
     return psycopg2.connect(
         dbname=os.getenv("DB_NAME", "basketball"),
         user=os.getenv("DB_USER", "postgres"),
@@ -17,14 +36,14 @@ def get_connection():
         port=os.getenv("DB_PORT", "5432"),
     )
 
-def run_seed():
-    conn = get_connection()
+def run_seed(scale=1, seed=None, seasons=1, workers=1, dsn=None):
+    conn = get_connection(dsn)
     cur = conn.cursor()
 
     print("Cleaning database...")
     cur.execute("""
         TRUNCATE TABLE
-            player_game_stats, game_participant, game, member_of,
+            leaderboard_totals, player_career_stats, player_game_stats, game_participant, game, member_of,
             participates_in_league, participates_in, has_sponsor_club,
             has_sponsor_team, player, clubs, national_team, sponsor,
             league, championship
@@ -249,85 +268,420 @@ def run_seed():
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """, (gid, player_map[pid], p2m, p2a, p3m, p3a, ftm, fta, ast, reb, blk))
 
-    print("Inserting Realistic Filler Data...")
-    # --- Filler Data (Realistic names via Faker) ---
-
-    # 1. Leagues (20)
-    filler_leagues = []
-    for _ in range(20):
-        name = f"{fake.country()} {random.choice(['League', 'Pro A', 'Elite', 'Basket League', 'Premier League'])}"
-        cur.execute("INSERT INTO league (league_id, name, country, level) VALUES (%s, %s, %s, %s) RETURNING id_lea",
-                    (fake.unique.bothify(text='LEA###'), name, fake.country(), random.choice(['Pro', 'Elite', 'D1'])))
-        filler_leagues.append(cur.fetchone()[0])
-
-    # 2. Clubs (50)
-    filler_clubs = []
-    for _ in range(50):
-        city = fake.city()
-        name = f"{city} {random.choice(['Basket', 'Lions', 'Tigers', 'Hoops', 'BC', 'United'])}"
-        cur.execute("INSERT INTO clubs (club_id, name, city) VALUES (%s, %s, %s) RETURNING id_clu",
-                    (fake.unique.bothify(text='CLB###'), name, city))
-        cid = cur.fetchone()[0]
-        filler_clubs.append(cid)
-        # Link to a random league
-        cur.execute("INSERT INTO participates_in_league (id_lea, id_clu) VALUES (%s, %s)",
-                    (random.choice(filler_leagues), cid))
-
-    # 3. Players (200)
-    filler_players = []
-    for _ in range(200):
-        dob = fake.date_of_birth(minimum_age=18, maximum_age=38)
-        # Utiliser uniquement les pays qui ont une équipe nationale
-        player_country = random.choice(all_countries)
-        cur.execute("""
-            INSERT INTO player (player_id, name, date_of_birth, height, citizenship, current_club_id)
-            VALUES (%s, %s, %s, %s, %s, %s) RETURNING id_pla
-        """, (fake.unique.bothify(text='PLY####'), fake.name_male(), dob,
-              round(random.uniform(1.80, 2.20), 2), player_country, random.choice(filler_clubs)))
-        filler_players.append(cur.fetchone()[0])
-
-    # 4. Games (100 random games)
-    for _ in range(100):
-        is_league = random.choice([True, False])
-        if is_league:
-            lid = random.choice(filler_leagues)
-            cid = None
-            gtype = 'Regular'
-        else:
-            lid = None
-            cid = champ_map['CHA_WC2023'] # Reuse a champ for simplicity or create new ones
-            gtype = 'Group Stage'
+    # Filler en chargement massif : les ID curés sont déjà attribués, on
+    # repart du maximum de chaque table.
+    cur.execute("""
+        SELECT
+            (SELECT COALESCE(MAX(id_lea), 0) FROM league),
+            (SELECT COALESCE(MAX(id_clu), 0) FROM clubs),
+            (SELECT COALESCE(MAX(id_pla), 0) FROM player),
+            (SELECT COALESCE(MAX(id_gam), 0) FROM game),
+            (SELECT COALESCE(MAX(id_stat), 0) FROM player_game_stats)
+    """)
+    id_bases = dict(zip(("league", "club", "player", "game", "stat"), cur.fetchone()))
+    conn.commit()
 
-        cur.execute("""
-            INSERT INTO game (game_id, game_date, location, game_type, season, id_lea, id_cha)
-            VALUES (%s, %s, %s, %s, %s, %s, %s) RETURNING id_gam
-        """, (fake.unique.bothify(text='GAM####'), fake.date_between(start_date='-1y', end_date='today'),
-              fake.city(), gtype, '2023/2024', lid, cid))
-        gid = cur.fetchone()[0]
-
-        # Participants (Just pick 2 random clubs for simplicity, even if champ game for filler)
-        c1, c2 = random.sample(filler_clubs, 2)
-        s1, s2 = random.randint(60, 110), random.randint(60, 110)
-        cur.execute("INSERT INTO game_participant (id_gam, participant_id, participant_type, score, role) VALUES (%s, %s, 'Club', %s, 'Home')", (gid, c1, s1))
-        cur.execute("INSERT INTO game_participant (id_gam, participant_id, participant_type, score, role) VALUES (%s, %s, 'Club', %s, 'Away')", (gid, c2, s2))
-
-        # Stats for some players in these clubs
-        # (Simplified: just pick random players from the DB to give them stats)
-        for pid in random.sample(filler_players, 5):
-            cur.execute("""
-                INSERT INTO player_game_stats (id_gam, id_pla, points_2pts_made, points_2pts_attempted,
-                points_3pts_made, points_3pts_attempted, free_throws_made, free_throws_attempted,
-                assists, rebounds, blocks)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (gid, pid, random.randint(0, 10), random.randint(5, 15),
-                  random.randint(0, 5), random.randint(0, 10),
-                  random.randint(0, 5), random.randint(0, 10),
-                  random.randint(0, 10), random.randint(0, 15), random.randint(0, 3)))
+    load_filler_data(conn, scale, seed, seasons, all_countries, id_bases, workers=workers, dsn=dsn)
 
-    conn.commit()
     cur.close()
     conn.close()
     print("Database seeded successfully with Realistic & Curated data!")
 
+
+# --- Filler Data (volume paramétrable, chargé par COPY) ---------------------
+
+
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, str):
+        return (
+            value.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+class CopyWriter:
+    # Accumule des lignes au format texte de COPY et les envoie par lots
+
+    def __init__(self, table, columns):
+        self.table = table
+        self.columns = columns
+        self.buffer = io.StringIO()
+        self.pending = 0
+        self.total = 0
+        self.seconds = 0.0
+
+    def add(self, row):
+        self.buffer.write("\t".join(_copy_value(value) for value in row))
+        self.buffer.write("\n")
+        self.pending += 1
+
+    def flush(self, cur):
+        if not self.pending:
+            return
+        started = time.perf_counter()
+        self.buffer.seek(0)
+        cur.copy_expert(
+            f"COPY {self.table} ({', '.join(self.columns)}) FROM STDIN",
+            self.buffer,
+        )
+        self.seconds += time.perf_counter() - started
+        self.total += self.pending
+        self.pending = 0
+        self.buffer = io.StringIO()
+
+
+# Ordre de chargement imposé par les clés étrangères
+FILLER_TABLES = [
+    ("league", ("id_lea", "league_id", "name", "country", "level")),
+    ("clubs", ("id_clu", "club_id", "name", "city")),
+    ("participates_in_league", ("id_lea", "id_clu")),
+    ("player", ("id_pla", "player_id", "name", "date_of_birth", "height", "citizenship", "current_club_id")),
+    ("game", ("id_gam", "game_id", "game_date", "location", "game_type", "season", "id_lea", "id_cha")),
+    ("game_participant", ("id_gam", "participant_id", "participant_type", "score", "role")),
+    ("player_game_stats", (
+        "id_gam", "id_pla", "id_stat", "points_2pts_made", "points_2pts_attempted",
+        "points_3pts_made", "points_3pts_attempted", "free_throws_made", "free_throws_attempted",
+        "assists", "rebounds", "blocks",
+    )),
+]
+
+
+def _base36(number):
+    digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    encoded = ""
+    while True:
+        number, remainder = divmod(number, 36)
+        encoded = digits[remainder] + encoded
+        if not number:
+            return encoded
+
+
+def _business_id(prefix, number):
+    # VARCHAR(10) : préfixe de 3 lettres + 7 caractères base 36
+    return prefix + _base36(number).rjust(7, "0")
+
+
+def build_name_pools(seed):
+    # Faker est lent ligne à ligne : on tire une fois des listes de prénoms,
+    # noms, villes et pays, puis on les combine au hasard.
+    # Un Faker par langue et langue tirée par un random.Random dédié : un Faker
+    # multi-langues choisit la sienne avec le module random global, ce qui rendrait
+    # les listes dépendantes de l'état de celui-ci malgré --seed.
+    rng = random.Random(f"{seed}:names")
+    fakers = []
+    for locale in ('en_US', 'fr_FR', 'es_ES', 'it_IT'):
+        locale_faker = Faker(locale)
+        locale_faker.seed_instance(seed)
+        # it_IT tire ses villes d'une liste construite depuis un set, dont l'ordre
+        # change avec PYTHONHASHSEED : on la trie pour que le tirage soit reproductible
+        for provider in locale_faker.providers:
+            if isinstance(getattr(provider, "cities", None), list):
+                provider.cities = sorted(provider.cities)
+        fakers.append(locale_faker)
+
+    def draw(method, count):
+        return sorted({getattr(rng.choice(fakers), method)() for _ in range(count)})
+
+    return {
+        "first_names": draw("first_name_male", 2000),
+        "last_names": draw("last_name", 4000),
+        "cities": draw("city", 2000),
+        "countries": draw("country", 500),
+    }
+
+
+def _season_dates(season_start):
+    # Saison régulière d'octobre à avril, finale fin mai
+    return date(season_start, 10, 1), date(season_start + 1, 4, 30), date(season_start + 1, 5, 25)
+
+
+def _stat_line(rng, skill):
+    p2a = int(rng.random() * 12 * skill) + 1
+    p2m = int(p2a * (0.35 + 0.25 * rng.random()))
+    p3a = int(rng.random() * 8 * skill)
+    p3m = int(p3a * (0.25 + 0.2 * rng.random()))
+    fta = int(rng.random() * 6 * skill)
+    ftm = int(fta * (0.6 + 0.3 * rng.random()))
+    return [
+        p2m, p2a, p3m, p3a, ftm, fta,
+        int(rng.random() * 8 * skill),   # assists
+        int(rng.random() * 10 * skill),  # rebounds
+        int(rng.random() * 2.5 * skill),  # blocks
+    ]
+
+
+def _line_points(line):
+    return 2 * line[0] + 3 * line[2] + line[4]
+
+
+def generate_league(unit, seed, seasons, pools, countries, id_bases):
+    # Une ligue complète (clubs, joueurs, matchs, participants, stats) pour
+    # l'unité `unit`. Les ID sont dérivés de l'unité : deux unités ne se
+    # chevauchent jamais, quel que soit l'ordre de génération.
+    rng = random.Random(f"{seed}:{unit}")
+    games_per_league = GAMES_PER_LEAGUE_SEASON * seasons
+    rows = {table: [] for table, _ in FILLER_TABLES}
+
+    id_lea = id_bases["league"] + unit + 1
+    league_country = rng.choice(pools["countries"])
+    rows["league"].append((
+        id_lea,
+        _business_id("LEA", id_lea),
+        f"{league_country} {rng.choice(['League', 'Pro A', 'Elite', 'Basket League', 'Premier League'])}",
+        league_country,
+        rng.choice(['Pro', 'Elite', 'D1']),
+    ))
+
+    clubs = []
+    for k in range(CLUBS_PER_LEAGUE):
+        id_clu = id_bases["club"] + unit * CLUBS_PER_LEAGUE + k + 1
+        city = rng.choice(pools["cities"])
+        rows["clubs"].append((
+            id_clu,
+            _business_id("CLB", id_clu),
+            f"{city} {rng.choice(['Basket', 'Lions', 'Tigers', 'Hoops', 'BC', 'United'])}",
+            city,
+        ))
+        rows["participates_in_league"].append((id_lea, id_clu))
+
+        roster = []
+        for j in range(PLAYERS_PER_CLUB):
+            id_pla = id_bases["player"] + (unit * CLUBS_PER_LEAGUE + k) * PLAYERS_PER_CLUB + j + 1
+            rows["player"].append((
+                id_pla,
+                _business_id("PLY", id_pla),
+                f"{rng.choice(pools['first_names'])} {rng.choice(pools['last_names'])}",
+                date(1986, 1, 1) + timedelta(days=rng.randrange(20 * 365)),
+                round(rng.uniform(1.80, 2.20), 2),
+                rng.choice(countries),
+                id_clu,
+            ))
+            # Le niveau du joueur conditionne ses stats sur toute la saison
+            roster.append((id_pla, 0.5 + rng.random()))
+        clubs.append({"id": id_clu, "city": city, "roster": roster})
+
+    game_index = 0
+    stat_index = 0
+
+    def play_game(game_date, game_type, season, home, away):
+        nonlocal game_index, stat_index
+        id_gam = id_bases["game"] + unit * games_per_league + game_index + 1
+        game_index += 1
+        rows["game"].append((
+            id_gam, _business_id("GAM", id_gam), game_date, f"{home['city']} Arena",
+            game_type, season, id_lea, None,
+        ))
+
+        # Seuls des joueurs des deux clubs ont une ligne de stats ; le score de
+        # chaque club est la somme des points de ses joueurs.
+        lines = {}
+        for club in (home, away):
+            lines[club["id"]] = [
+                (id_pla, _stat_line(rng, skill))
+                for id_pla, skill in rng.sample(club["roster"], PLAYERS_PER_GAME)
+            ]
+        scores = {club_id: sum(_line_points(line) for _, line in club_lines) for club_id, club_lines in lines.items()}
+        if scores[home["id"]] == scores[away["id"]]:
+            # Pas de match nul : un lancer franc de plus pour un joueur local
+            line = lines[home["id"]][0][1]
+            line[4] += 1
+            line[5] += 1
+            scores[home["id"]] += 1
+
+        for club, role in ((home, "Home"), (away, "Away")):
+            rows["game_participant"].append((id_gam, club["id"], "Club", scores[club["id"]], role))
+            for id_pla, line in lines[club["id"]]:
+                stat_index += 1
+                rows["player_game_stats"].append(
+                    (id_gam, id_pla, id_bases["stat"] + unit * games_per_league * STATS_PER_GAME + stat_index, *line)
+                )
+        return scores[home["id"]] > scores[away["id"]]
+
+    for season_offset in range(seasons):
+        season_start = LAST_FILLER_SEASON_START - season_offset
+        season = f"{season_start}/{season_start + 1}"
+        first_day, last_day, final_day = _season_dates(season_start)
+        span = (last_day - first_day).days
+        wins = {club["id"]: 0 for club in clubs}
+        for home in clubs:
+            for away in clubs:
+                if home is away:
+                    continue
+                home_won = play_game(first_day + timedelta(days=rng.randrange(span)), 'Regular', season, home, away)
+                wins[home["id"] if home_won else away["id"]] += 1
+        finalists = sorted(clubs, key=lambda club: (-wins[club["id"]], club["id"]))[:2]
+        play_game(final_day, 'Final', season, finalists[0], finalists[1])
+
+    return rows
+
+
+def secondary_indexes():
+    # Index déclarés dans CreateTables.sql : supprimés avant le chargement, recréés après
+    with open(CREATE_TABLES_PATH, "r", encoding="utf-8") as f:
+        sql = f.read()
+    pattern = re.compile(r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+(\w+)\s+ON\s+[^;]+;", re.IGNORECASE)
+    return [(match.group(1), match.group(0)) for match in pattern.finditer(sql)]
+
+
+def load_units(conn, units, seed, seasons, pools, countries, id_bases):
+    cur = conn.cursor()
+    writers = [CopyWriter(table, columns) for table, columns in FILLER_TABLES]
+    by_table = {writer.table: writer for writer in writers}
+    for unit in units:
+        for table, table_rows in generate_league(unit, seed, seasons, pools, countries, id_bases).items():
+            for row in table_rows:
+                by_table[table].add(row)
+        if by_table["player_game_stats"].pending >= COPY_BATCH_ROWS:
+            for writer in writers:
+                writer.flush(cur)
+    for writer in writers:
+        writer.flush(cur)
+    conn.commit()
+    cur.close()
+    return {writer.table: (writer.total, writer.seconds) for writer in writers}
+
+
+# Contexte partagé par les processus de génération (voir _init_worker)
+_worker_context = {}
+
+
+def _init_worker(seed, seasons, pools, countries, id_bases, dsn):
+    _worker_context.update(
+        seed=seed, seasons=seasons, pools=pools, countries=countries, id_bases=id_bases, dsn=dsn
+    )
+
+
+def _load_chunk(units):
+    # Exécuté dans un processus du pool : sa propre connexion, sa propre transaction.
+    # Les plages d'ID étant dérivées de l'unité, aucune coordination n'est nécessaire.
+    conn = get_connection(_worker_context["dsn"])
+    try:
+        return load_units(
+            conn,
+            units,
+            _worker_context["seed"],
+            _worker_context["seasons"],
+            _worker_context["pools"],
+            _worker_context["countries"],
+            _worker_context["id_bases"],
+        )
+    finally:
+        conn.close()
+
+
+def load_units_parallel(leagues, workers, seed, seasons, pools, countries, id_bases, dsn=None):
+    # Plusieurs petits lots par processus pour équilibrer la charge
+    chunk_size = max(1, leagues // (workers * 4))
+    chunks = [range(start, min(start + chunk_size, leagues)) for start in range(0, leagues, chunk_size)]
+    totals = {table: [0, 0.0] for table, _ in FILLER_TABLES}
+    with multiprocessing.Pool(
+        workers, initializer=_init_worker, initargs=(seed, seasons, pools, countries, id_bases, dsn)
+    ) as pool:
+        for done, chunk_totals in enumerate(pool.imap_unordered(_load_chunk, chunks), start=1):
+            for table, (rows, seconds) in chunk_totals.items():
+                totals[table][0] += rows
+                totals[table][1] += seconds
+            print(f"  chunk {done}/{len(chunks)} loaded", flush=True)
+    return {table: tuple(values) for table, values in totals.items()}
+
+
+def load_filler_data(conn, scale, seed, seasons, countries, id_bases, workers=1, dsn=None):
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    leagues = LEAGUES_PER_SCALE * scale
+    workers = max(1, min(workers, leagues))
+    print(
+        f"Inserting Realistic Filler Data (scale={scale}, seed={seed}, seasons={seasons}, workers={workers}): "
+        f"{leagues} leagues, {leagues * GAMES_PER_LEAGUE_SEASON * seasons} games, "
+        f"{leagues * GAMES_PER_LEAGUE_SEASON * seasons * STATS_PER_GAME} stat lines..."
+    )
+    cur = conn.cursor()
+
+    indexes = secondary_indexes()
+    for name, _ in indexes:
+        cur.execute(f"DROP INDEX IF EXISTS {name}")
+    # Triggers d'agrégats remplacés par une reconstruction finale, triggers de version
+    # (Data_Version) par un seul incrément par table : sinon chaque worker verrouille la
+    # ligne de version dès son premier COPY et les autres l'attendent jusqu'à son commit
+    for table, _ in FILLER_TABLES:
+        cur.execute(f"ALTER TABLE {table} DISABLE TRIGGER USER")
+    conn.commit()
+    cur.close()
+
+    try:
+        started = time.perf_counter()
+        pools = build_name_pools(seed)
+        if workers == 1:
+            totals = load_units(conn, range(leagues), seed, seasons, pools, countries, id_bases)
+        else:
+            totals = load_units_parallel(leagues, workers, seed, seasons, pools, countries, id_bases, dsn)
+        elapsed = time.perf_counter() - started
+        for table, (count, copy_seconds) in totals.items():
+            print(
+                f"  {table}: {count} rows, {count / elapsed:,.0f} rows/s "
+                f"(COPY {copy_seconds:.1f}s cumulated)"
+            )
+        print(f"Loaded in {elapsed:.1f}s")
+    finally:
+        # Même si un worker échoue ou si le chargement est interrompu : index et
+        # triggers rétablis, agrégats recalculés sur les lignes déjà validées
+        conn.rollback()
+        restore_after_load(conn, indexes)
+
+
+def restore_after_load(conn, indexes):
+    print("Rebuilding indexes, aggregates, leaderboards and materialized views...")
+    started = time.perf_counter()
+    cur = conn.cursor()
+    for _, ddl in indexes:
+        cur.execute(ddl)
+    for table, _ in FILLER_TABLES:
+        cur.execute(f"ALTER TABLE {table} ENABLE TRIGGER USER")
+        # Le trigger de version était désactivé pendant le COPY
+        cur.execute("SELECT bump_table_version(%s)", (table,))
+    cur.execute("SELECT rebuild_player_career_stats()")
+    cur.execute("SELECT rebuild_leaderboard_totals()")
+    # Vues matérialisées remplies (ou rafraîchies) sur les nouvelles données
+    cur.execute(
+        "SELECT refresh_materialized_view(matviewname) FROM pg_matviews "
+        "WHERE schemaname = current_schema()"
+    )
+    for table, column in (
+        ("league", "id_lea"),
+        ("clubs", "id_clu"),
+        ("player", "id_pla"),
+        ("game", "id_gam"),
+        ("player_game_stats", "id_stat"),
+    ):
+        cur.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), "
+            f"(SELECT COALESCE(MAX({column}), 1) FROM {table}))"
+        )
+    conn.commit()
+    conn.autocommit = True
+    cur.execute("ANALYZE")
+    conn.autocommit = False
+    cur.close()
+    print(f"Indexes, aggregates and materialized views rebuilt in {time.perf_counter() - started:.1f}s")
+
 if __name__ == "__main__":
-    run_seed()
+    parser = argparse.ArgumentParser(description="Seed the basketball database.")
+    parser.add_argument(
+        "--scale", type=int, default=1,
+        help=f"Filler volume: {LEAGUES_PER_SCALE} leagues of {CLUBS_PER_LEAGUE} clubs per unit (default: 1)",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible data")
+    parser.add_argument("--seasons", type=int, default=1, help="Seasons generated per league (default: 1)")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Generator processes, each with its own connection (default: CPU count)",
+    )
+    args = parser.parse_args()
+    run_seed(scale=args.scale, seed=args.seed, seasons=args.seasons, workers=args.workers)
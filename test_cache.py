@@ -0,0 +1,74 @@
+from app import app_cache, invalidate_tables
+from cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def total_players(client):
+    return client.get("/api/dashboard").get_json()["total_players"]
+
+
+def test_dashboard_invalidated_by_application_write(client, add_player):
+    add_player(1)
+    assert total_players(client) == 1
+
+    # Écriture hors session ORM : le cache n'est pas prévenu, l'entrée reste servie
+    add_player(2)
+    assert total_players(client) == 1
+
+    response = client.post("/players/new", data={
+        "player_id": "P3", "name": "New Player", "date_of_birth": "2001-02-03",
+    })
+    assert response.status_code == 302
+    assert total_players(client) == 3
+
+
+def test_invalidation_follows_table_dependencies(app):
+    dashboard, game_facets = app_cache("dashboard"), app_cache("game_facets")
+    dashboard.set("key", "value")
+    game_facets.set("key", "value")
+
+    invalidate_tables({"sponsor"})
+    assert dashboard.get("key") == "value"
+
+    invalidate_tables({"player"})
+    assert dashboard.get("key") is None
+    assert game_facets.get("key") == "value"
+
+    # Table inconnue (SQL brut) : tout est vidé
+    invalidate_tables()
+    assert game_facets.get("key") is None
+
+
+def test_ttl_expiry_and_lru_eviction():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, maxsize=2, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+    clock.now = 10
+    assert cache.get("a") is None
+
+
+def test_compute_started_before_invalidation_is_not_stored():
+    cache = TTLCache()
+
+    def compute():
+        # Écriture concurrente pendant le calcul : le résultat est déjà périmé
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get_or_compute("key", compute) == "stale"
+    assert cache.get("key") is None
+    assert cache.get_or_compute("key", lambda: "fresh") == "fresh"
+    assert cache.get("key") == "fresh"
@@ -0,0 +1,57 @@
+from app import rebuild_career_stats
+
+CAREER_SQL = "SELECT * FROM Player_Career_Stats ORDER BY ID_Pla"
+
+
+def career(execute, id_pla):
+    row = execute("SELECT * FROM Player_Career_Stats WHERE ID_Pla = :id", id=id_pla).mappings().first()
+    return dict(row) if row else None
+
+
+def test_insert_accumulates_totals(execute, add_player, add_game, add_stats):
+    add_player(1)
+    add_game(1)
+    add_game(2)
+    add_stats(1, 1, made_2=3, made_3=1, free_throws=2, rebounds=4)
+    add_stats(2, 1, made_2=1, assists=5, blocks=1)
+
+    totals = career(execute, 1)
+    assert totals["Games_played"] == 2
+    assert totals["Points"] == 2 * 4 + 3 * 1 + 2
+    assert (totals["Rebounds"], totals["Assists"], totals["Blocks"]) == (4, 5, 1)
+    assert totals["Points_2pts_attempted"] == 4
+
+
+def test_update_and_delete_adjust_totals(execute, add_player, add_game, add_stats):
+    add_player(1)
+    add_player(2)
+    add_game(1)
+    add_game(2)
+    add_stats(1, 1, made_2=5)
+    add_stats(2, 1, made_2=2)
+
+    execute("UPDATE PLAYER_GAME_STATS SET Points_2pts_made = 1 WHERE ID_Gam = 1 AND ID_Pla = 1")
+    assert career(execute, 1)["Points"] == 2 * 3
+
+    # Ligne réattribuée à un autre joueur : retirée de l'un, ajoutée à l'autre
+    execute("UPDATE PLAYER_GAME_STATS SET ID_Pla = 2 WHERE ID_Gam = 2")
+    assert (career(execute, 1)["Games_played"], career(execute, 1)["Points"]) == (1, 2)
+    assert (career(execute, 2)["Games_played"], career(execute, 2)["Points"]) == (1, 4)
+
+    execute("DELETE FROM PLAYER_GAME_STATS WHERE ID_Gam = 1")
+    assert career(execute, 1) is None
+
+
+def test_triggers_match_rebuild(execute, add_player, add_game, add_stats):
+    for id_pla in (1, 2, 3):
+        add_player(id_pla)
+    for id_gam in (1, 2, 3):
+        add_game(id_gam)
+        for id_pla in (1, 2, 3):
+            add_stats(id_gam, id_pla, made_2=id_gam + id_pla, made_3=id_pla, free_throws=id_gam, rebounds=id_gam * id_pla)
+    execute("UPDATE PLAYER_GAME_STATS SET Rebounds = Rebounds + 1 WHERE ID_Pla = 2")
+    execute("DELETE FROM PLAYER_GAME_STATS WHERE ID_Gam = 3 AND ID_Pla = 1")
+
+    incremental = [dict(row) for row in execute(CAREER_SQL).mappings()]
+    rebuild_career_stats()
+    assert [dict(row) for row in execute(CAREER_SQL).mappings()] == incremental
@@ -0,0 +1,125 @@
+import random
+
+import numpy as np
+import pytest
+
+from app import data_versions, db
+from columnar import TABLES, ColumnarStats
+
+POINTS = "2 * Points_2pts_made + 3 * Points_3pts_made + Free_throws_made"
+
+
+@pytest.fixture
+def league(execute, add_player, add_game, add_stats):
+    # Deux saisons, deux ligues, effectifs partiels : des matchs de taille variable
+    rng = random.Random(7)
+    for id_lea in (1, 2):
+        execute(
+            "INSERT INTO League (ID_Lea, League_ID, Name, Country, Level) VALUES (:id, :code, 'L', 'France', 1)",
+            id=id_lea, code=f"L{id_lea}",
+        )
+    for id_pla in range(1, 13):
+        add_player(id_pla)
+    for id_gam in range(1, 10):
+        add_game(id_gam, season="2023-2024" if id_gam <= 5 else "2024-2025", id_lea=1 + id_gam % 2)
+        for id_pla in rng.sample(range(1, 13), rng.randint(3, 10)):
+            add_stats(
+                id_gam, id_pla,
+                made_2=rng.randint(0, 12), made_3=rng.randint(0, 5), free_throws=rng.randint(0, 8),
+                rebounds=rng.randint(0, 15), assists=rng.randint(0, 10), blocks=rng.randint(0, 4),
+            )
+
+
+def sync(store):
+    versions = data_versions()
+    store.sync(db.session.connection(), {table: versions[table][0] for table in TABLES})
+    return store
+
+
+def loaded_store(refresh_interval=5):
+    return sync(ColumnarStats(refresh_interval=refresh_interval))
+
+
+def test_group_summary_matches_sql(execute, league):
+    summary = {group["key"]: group for group in loaded_store().group_summary("season", "points", (10, 50, 90))}
+
+    rows = execute(f"""
+        SELECT g.Season, COUNT(DISTINCT g.ID_Gam) AS games, COUNT(*) AS lines,
+               COUNT(DISTINCT pgs.ID_Pla) AS players, SUM({POINTS}) AS total
+        FROM PLAYER_GAME_STATS pgs JOIN Game g ON g.ID_Gam = pgs.ID_Gam
+        GROUP BY g.Season
+    """).all()
+    assert sorted(summary) == sorted(row.Season for row in rows)
+    for row in rows:
+        group = summary[row.Season]
+        values = [value for (value,) in execute(
+            f"SELECT {POINTS} FROM PLAYER_GAME_STATS pgs JOIN Game g ON g.ID_Gam = pgs.ID_Gam WHERE g.Season = :season",
+            season=row.Season,
+        )]
+        assert (group["games"], group["stat_lines"], group["players"], group["total"]) == \
+            (row.games, row.lines, row.players, row.total)
+        assert group["games"] in (4, 5)
+        assert group["mean"] == round(row.total / row.lines, 2)
+        for percentile, expected in zip((10, 50, 90), np.percentile(values, (10, 50, 90))):
+            assert group[f"p{percentile}"] == round(float(expected), 2)
+
+
+@pytest.mark.parametrize("dimension, key_sql", [("season", "g.Season"), ("league", "g.ID_Lea")])
+def test_player_splits_match_sql(execute, league, dimension, key_sql):
+    store = loaded_store()
+    for id_pla in (1, 6, 12):
+        expected = [
+            {"key": row.key, "games": row.games, "points": row.points, "rebounds": row.rebounds}
+            for row in execute(f"""
+                SELECT {key_sql} AS key, COUNT(DISTINCT pgs.ID_Gam) AS games,
+                       SUM({POINTS}) AS points, SUM(Rebounds) AS rebounds
+                FROM PLAYER_GAME_STATS pgs JOIN Game g ON g.ID_Gam = pgs.ID_Gam
+                WHERE pgs.ID_Pla = :id GROUP BY {key_sql} ORDER BY {key_sql}
+            """, id=id_pla)
+        ]
+        splits = store.player_splits(id_pla, dimension)
+        assert [{name: split[name] for name in ("key", "games", "points", "rebounds")} for split in splits] == expected
+
+
+def test_ranking_and_distribution_match_sql(execute, league):
+    store = loaded_store()
+    min_games = 4
+    averages = {
+        row.ID_Pla: row.average
+        for row in execute(f"""
+            SELECT ID_Pla, AVG({POINTS}) AS average FROM PLAYER_GAME_STATS
+            GROUP BY ID_Pla HAVING COUNT(*) >= :min_games
+        """, min_games=min_games)
+    }
+    assert len(averages) > 2
+
+    for id_pla in range(1, 13):
+        ranking = store.player_ranking(id_pla, "points", min_games)
+        if id_pla not in averages:
+            assert ranking is None
+            continue
+        average = averages[id_pla]
+        assert ranking["average"] == round(average, 1)
+        assert ranking["players"] == len(averages)
+        assert ranking["rank"] == 1 + sum(other > average for other in averages.values())
+
+    distribution = store.distribution("points", (25, 50, 75), min_games)
+    expected = np.percentile(sorted(averages.values()), (25, 50, 75))
+    assert distribution == {f"p{p}": round(float(value), 2) for p, value in zip((25, 50, 75), expected)}
+
+
+def test_incremental_refresh_reads_new_rows_only(execute, league, add_game, add_stats):
+    store = loaded_store(refresh_interval=0)
+    before = {group["key"]: group for group in store.group_summary("season", "points")}
+
+    add_game(10, season="2024-2025", id_lea=1)
+    add_stats(10, 1, made_2=10)
+    add_stats(10, 2, made_2=1)
+    sync(store)
+
+    after = {group["key"]: group for group in store.group_summary("season", "points")}
+    assert (store.full_loads, store.incremental_loads) == (1, 1)
+    assert after["2024-2025"]["games"] == before["2024-2025"]["games"] + 1
+    assert after["2024-2025"]["stat_lines"] == before["2024-2025"]["stat_lines"] + 2
+    assert after["2024-2025"]["total"] == before["2024-2025"]["total"] + 22
+    assert after["2023-2024"] == before["2023-2024"]
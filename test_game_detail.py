@@ -0,0 +1,62 @@
+from datetime import date, timedelta
+
+
+def box_score(client, etag=None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get("/games/1", headers=headers)
+
+
+def test_completed_game_revalidates_with_etag(client, add_player, add_game, add_stats):
+    add_player(1, "Adams")
+    add_game(1, game_date="2024-01-01")
+    add_stats(1, 1, made_2=4, rebounds=3)
+
+    response = box_score(client)
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    etag = response.headers["ETag"]
+
+    not_modified = box_score(client, etag)
+    assert not_modified.status_code == 304
+    assert not_modified.get_data() == b""
+    assert not_modified.headers["ETag"] == etag
+
+
+def test_etag_changes_with_any_displayed_table(client, execute, add_player, add_game, add_stats):
+    add_player(1, "Adams")
+    add_game(1, game_date="2024-01-01")
+    add_stats(1, 1, made_2=4)
+    etag = box_score(client).headers["ETag"]
+
+    # Rebonds seuls (points inchangés), puis nom du joueur : la page change, l'ETag aussi
+    execute("UPDATE PLAYER_GAME_STATS SET Rebounds = 9")
+    response = box_score(client, etag)
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    etag = response.headers["ETag"]
+    execute("UPDATE Player SET Name = 'Adams Jr' WHERE ID_Pla = 1")
+    response = box_score(client, etag)
+    assert response.status_code == 200
+    assert "Adams Jr" in response.get_data(as_text=True)
+
+
+def test_etag_depends_on_user(app, client, add_game):
+    add_game(1, game_date="2024-01-01")
+    viewer = app.test_client()
+    viewer.post("/login", data={"username": "viewer", "password": "viewer123"})
+
+    assert box_score(client).headers["ETag"] != box_score(viewer).headers["ETag"]
+    assert box_score(viewer, box_score(client).headers["ETag"]).status_code == 200
+
+
+def test_upcoming_game_has_no_etag(client, add_game):
+    add_game(1, game_date=(date.today() + timedelta(days=7)).isoformat())
+
+    response = box_score(client)
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+
+def test_unknown_game_is_404(client):
+    assert box_score(client).status_code == 404
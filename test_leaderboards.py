@@ -0,0 +1,92 @@
+import pytest
+
+from app import rebuild_leaderboards
+
+TOTALS_SQL = "SELECT * FROM Leaderboard_Totals ORDER BY Scope, Scope_key, ID_Pla"
+
+
+@pytest.fixture
+def competitions(execute):
+    for id_lea in (1, 2):
+        execute(
+            "INSERT INTO League (ID_Lea, League_ID, Name, Country, Level) VALUES (:id, :code, :name, 'France', 1)",
+            id=id_lea, code=f"L{id_lea}", name=f"League {id_lea}",
+        )
+    execute("INSERT INTO Championship (ID_Cha, Championship_ID, Name, Year, Type) VALUES (1, 'C1', 'Cup', 2024, 'World')")
+
+
+def totals(execute):
+    return [dict(row) for row in execute(TOTALS_SQL).mappings()]
+
+
+def scopes(execute, id_pla):
+    return {
+        (row["Scope"], row["Scope_key"]): row["Points"]
+        for row in execute("SELECT * FROM Leaderboard_Totals WHERE ID_Pla = :id", id=id_pla).mappings()
+    }
+
+
+def test_stat_line_counts_in_every_scope_of_its_game(execute, competitions, add_player, add_game, add_stats):
+    add_player(1)
+    add_game(1, season="2023-2024", id_lea=1)
+    add_game(2, season="2023-2024", id_cha=1)
+    add_stats(1, 1, made_2=5)
+    add_stats(2, 1, made_3=2)
+
+    assert scopes(execute, 1) == {
+        ("overall", ""): 16,
+        ("season", "2023-2024"): 16,
+        ("league", "1"): 10,
+        ("championship", "1"): 6,
+        ("national", ""): 6,
+    }
+
+
+def test_moving_a_game_moves_its_totals(execute, competitions, add_player, add_game, add_stats):
+    add_player(1)
+    add_game(1, season="2023-2024", id_lea=1)
+    add_stats(1, 1, made_2=5)
+
+    execute("UPDATE Game SET ID_Lea = 2, Season = '2024-2025' WHERE ID_Gam = 1")
+    assert scopes(execute, 1) == {("overall", ""): 10, ("season", "2024-2025"): 10, ("league", "2"): 10}
+
+
+def test_deleting_the_last_line_removes_the_player(execute, competitions, add_player, add_game, add_stats):
+    add_player(1)
+    add_game(1, id_lea=1)
+    add_stats(1, 1, made_2=5)
+
+    execute("DELETE FROM PLAYER_GAME_STATS")
+    assert scopes(execute, 1) == {}
+
+
+def test_triggers_match_rebuild(execute, competitions, add_player, add_game, add_stats):
+    for id_pla in (1, 2, 3, 4):
+        add_player(id_pla)
+    add_game(1, season="2023-2024", id_lea=1)
+    add_game(2, season="2023-2024", id_lea=2)
+    add_game(3, season="2024-2025", id_cha=1)
+    for id_gam in (1, 2, 3):
+        for id_pla in (1, 2, 3):
+            add_stats(id_gam, id_pla, made_2=id_gam * id_pla, made_3=id_pla, free_throws=id_gam, assists=id_pla)
+    execute("UPDATE PLAYER_GAME_STATS SET Points_2pts_made = 0 WHERE ID_Pla = 2")
+    execute("UPDATE PLAYER_GAME_STATS SET ID_Pla = 4 WHERE ID_Gam = 1 AND ID_Pla = 1")
+    execute("UPDATE Game SET Season = '2022-2023', ID_Lea = 1 WHERE ID_Gam = 2")
+    execute("DELETE FROM PLAYER_GAME_STATS WHERE ID_Gam = 3 AND ID_Pla = 2")
+
+    incremental = totals(execute)
+    rebuild_leaderboards()
+    assert totals(execute) == incremental
+
+
+def test_leaderboard_api(client, competitions, add_player, add_game, add_stats):
+    add_player(1, "Adams")
+    add_player(2, "Brown")
+    add_game(1, season="2023-2024", id_lea=1)
+    add_stats(1, 1, made_2=2)
+    add_stats(1, 2, made_2=6)
+
+    leaders = client.get("/api/leaderboards/season/points?key=2023-2024").get_json()["leaders"]
+    assert [(leader["rank"], leader["name"], leader["value"]) for leader in leaders] == [(1, "Brown", 12), (2, "Adams", 4)]
+    assert client.get("/api/leaderboards/season/points").status_code == 400
+    assert client.get("/api/leaderboards/overall/height").status_code == 404
@@ -0,0 +1,67 @@
+import pytest
+
+
+@pytest.fixture
+def small_pages(app):
+    app.config.update(PLAYERS_PAGE_SIZE=2, GAMES_PAGE_SIZE=2)
+
+
+def player_names(page):
+    return [player["name"] for player in page["players"]]
+
+
+def test_players_forward_and_backward(client, add_player, small_pages):
+    # Homonymes : l'ordre (Name, ID_Pla) départage les ex aequo
+    for id_pla, name in [(5, "Dupont"), (1, "Adams"), (4, "Dupont"), (2, "Brown"), (3, "Clark")]:
+        add_player(id_pla, name)
+
+    first = client.get("/players?format=json").get_json()
+    assert player_names(first) == ["Adams", "Brown"]
+    assert first["prev_cursor"] is None
+
+    second = client.get("/players", query_string={"format": "json", "cursor": first["next_cursor"]}).get_json()
+    assert [player["id_pla"] for player in second["players"]] == [3, 4]
+
+    third = client.get("/players", query_string={"format": "json", "cursor": second["next_cursor"]}).get_json()
+    assert [player["id_pla"] for player in third["players"]] == [5]
+    assert third["next_cursor"] is None
+
+    back = client.get("/players", query_string={"format": "json", "cursor": third["prev_cursor"]}).get_json()
+    assert [player["id_pla"] for player in back["players"]] == [3, 4]
+    back = client.get("/players", query_string={"format": "json", "cursor": back["prev_cursor"]}).get_json()
+    assert player_names(back) == ["Adams", "Brown"]
+    assert back["prev_cursor"] is None
+
+
+def test_games_newest_first_with_date_ties(client, add_game, small_pages):
+    add_game(1, game_date="2024-01-01")
+    add_game(2, game_date="2024-01-03")
+    add_game(3, game_date="2024-01-03")
+    add_game(4, game_date="2024-01-02")
+
+    seen, cursor = [], None
+    while True:
+        query = {"format": "json", **({"cursor": cursor} if cursor else {})}
+        page = client.get("/games", query_string=query).get_json()
+        seen.extend(game["id_gam"] for game in page["games"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [3, 2, 4, 1]
+
+
+def test_page_not_shifted_by_insert(client, add_player, small_pages):
+    for id_pla, name in [(1, "Adams"), (2, "Brown"), (3, "Clark"), (4, "Davis")]:
+        add_player(id_pla, name)
+    first = client.get("/players?format=json").get_json()
+
+    # Insertion avant la page suivante : un OFFSET la décalerait, pas le curseur
+    add_player(5, "Aaron")
+    second = client.get("/players", query_string={"format": "json", "cursor": first["next_cursor"]}).get_json()
+    assert player_names(second) == ["Clark", "Davis"]
+
+
+def test_invalid_cursor_is_rejected(client):
+    assert client.get("/players", query_string={"cursor": "not-a-cursor"}).status_code == 400
+    # ["up", [1]] : direction inconnue
+    assert client.get("/games", query_string={"cursor": "WyJ1cCIsWzFdXQ"}).status_code == 400
@@ -0,0 +1,119 @@
+import os
+
+from sqlalchemy import text
+
+from app import app_query_registry, cached_query_result, create_app, db, install_view
+from query_registry import QueryRegistry, classify, referenced_tables
+
+
+def write(path, sql, mtime=None):
+    path.write_text(sql, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+def test_classify():
+    assert classify("CREATE OR REPLACE VIEW v AS SELECT 1") == ("view", "v")
+    assert classify("-- commentaire\n/* bloc */ WITH t AS (SELECT 1) SELECT * FROM t") == ("select", None)
+    assert classify("UPDATE Player SET Height = 2") == ("dml", None)
+
+
+def test_loads_patterns_and_tables(tmp_path):
+    (tmp_path / "SqlView").mkdir()
+    write(tmp_path / "req1.sql", "SELECT p.Name FROM Player p JOIN Clubs c ON c.ID_Clu = p.Current_club_id")
+    write(tmp_path / "SqlView" / "view1.sql", "CREATE VIEW V1 AS SELECT * FROM Game")
+    write(tmp_path / "notes.txt", "SELECT 1")
+    registry = QueryRegistry(str(tmp_path), patterns=("req*.sql", "SqlView/*.sql"))
+    registry.load()
+
+    queries = registry.queries()
+    assert sorted(queries) == ["req1", "view1"]
+    assert queries["req1"].tables == {"player", "clubs"}
+    assert queries["view1"].run_sql == "SELECT * FROM V1"
+
+
+def test_reloads_changed_added_and_removed_files(tmp_path):
+    write(tmp_path / "req1.sql", "SELECT 1", mtime=1_000_000_000)
+    registry = QueryRegistry(str(tmp_path), patterns=("req*.sql",), check_interval=0)
+    registry.load()
+    assert registry.get("req1").sql == "SELECT 1"
+
+    write(tmp_path / "req1.sql", "SELECT 2", mtime=2_000_000_000)
+    assert registry.get("req1").sql == "SELECT 2"
+
+    write(tmp_path / "req2.sql", "SELECT 3")
+    os.utime(tmp_path, ns=(3_000_000_000, 3_000_000_000))
+    assert sorted(registry.queries()) == ["req1", "req2"]
+
+    (tmp_path / "req1.sql").unlink()
+    os.utime(tmp_path, ns=(4_000_000_000, 4_000_000_000))
+    assert sorted(registry.queries()) == ["req2"]
+
+
+def test_no_reload_within_check_interval(tmp_path):
+    write(tmp_path / "req1.sql", "SELECT 1", mtime=1_000_000_000)
+    registry = QueryRegistry(str(tmp_path), patterns=("req*.sql",), check_interval=3600)
+    registry.load()
+    write(tmp_path / "req1.sql", "SELECT 2", mtime=2_000_000_000)
+    assert registry.get("req1").sql == "SELECT 1"
+
+
+def test_view_installed_once_per_version(app, tmp_path):
+    write(tmp_path / "view1.sql", "CREATE OR REPLACE VIEW V_Test AS SELECT 1 AS one", mtime=1_000_000_000)
+    registry = QueryRegistry(str(tmp_path), patterns=("view*.sql",), check_interval=0)
+    registry.load()
+    app.extensions["bd"]["query_registry"] = registry
+
+    assert install_view(registry.get("view1"), 1000)
+    assert not install_view(registry.get("view1"), 1000)
+
+    write(tmp_path / "view1.sql", "CREATE OR REPLACE VIEW V_Test AS SELECT 2 AS one", mtime=2_000_000_000)
+    assert install_view(registry.get("view1"), 1000)
+    assert db.session.execute(text("SELECT one FROM V_Test")).scalar() == 2
+
+
+def test_installed_views_are_tracked_per_app(app):
+    # Deux applications, deux bases : une vue installée dans l'une reste à installer dans l'autre
+    other = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://", "TESTING": True})
+    query = app_query_registry().get("view2")
+    assert query is not None and query.kind == "view"
+
+    assert install_view(query, 1000)
+    with other.app_context():
+        assert app_query_registry() is not app.extensions["bd"]["query_registry"]
+        assert install_view(app_query_registry().get("view2"), 1000)
+        assert db.session.execute(text(f"SELECT COUNT(*) FROM {query.view_name}")).scalar() == 0
+
+
+def test_referenced_tables():
+    assert referenced_tables("SELECT * FROM Player p, Clubs AS c WHERE p.Current_club_id = c.ID_Clu") == {"player", "clubs"}
+    assert referenced_tables("SELECT * FROM public.game g JOIN (SELECT * FROM League) l ON true, Championship") == \
+        {"game", "league", "championship"}
+    assert referenced_tables("WITH t AS (SELECT * FROM Game) SELECT 'FROM x' FROM t -- JOIN y") == {"game"}
+    # Pas d'analyse sûre : aucune table garantie
+    assert referenced_tables("SELECT * FROM generate_series(1, 3)") is None
+    assert referenced_tables("SELECT * FROM (SELECT 1") is None
+
+
+def test_comma_join_result_invalidated_by_each_table(app, execute, add_player, tmp_path):
+    write(tmp_path / "req1.sql", "SELECT p.Name, c.Name FROM Player p, Clubs c WHERE p.Current_club_id = c.ID_Clu")
+    registry = QueryRegistry(str(tmp_path), patterns=("req*.sql",))
+    registry.load()
+    query = registry.get("req1")
+
+    assert cached_query_result(query, 100)[3]["tables"] == ["clubs", "player"]
+    assert cached_query_result(query, 100)[3]["hit"]
+    execute("INSERT INTO Clubs (ID_Clu, Club_ID, Name, City) VALUES (1, 'C1', 'Club', 'Paris')")
+    assert not cached_query_result(query, 100)[3]["hit"]
+
+
+def test_uncertain_tables_are_not_cached(app, tmp_path):
+    write(tmp_path / "req1.sql", "SELECT COUNT(*) FROM Player, MV_Club_Average_Height")
+    write(tmp_path / "req2.sql", "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 3) SELECT x FROM n")
+    registry = QueryRegistry(str(tmp_path), patterns=("req*.sql",))
+    registry.load()
+
+    # Vue sans version, puis aucune table : le résultat n'est pas mis en cache
+    assert cached_query_result(registry.get("req1"), 100)[3] is None
+    columns, rows, truncated, cache_info = cached_query_result(registry.get("req2"), 100)
+    assert [row[0] for row in rows] == [1, 2, 3] and cache_info is None
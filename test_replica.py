@@ -0,0 +1,96 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+
+from app import create_app, create_schema, db
+
+
+def sqlite_file(path, players):
+    # Une base par fichier, schéma et joueurs propres : on sait ainsi laquelle a répondu
+    url = f"sqlite:///{path}"
+    app = create_app({"SQLALCHEMY_DATABASE_URI": url})
+    with app.app_context():
+        create_schema()
+        for id_pla, name in players:
+            db.session.execute(
+                text("INSERT INTO Player (ID_Pla, Player_ID, Name, Date_of_birth, Height) "
+                     "VALUES (:id, :code, :name, '2000-01-01', 1.9)"),
+                {"id": id_pla, "code": f"P{id_pla}", "name": name},
+            )
+        db.session.commit()
+        db.engine.dispose()
+    return url
+
+
+@pytest.fixture
+def routed_app(tmp_path):
+    primary = sqlite_file(tmp_path / "primary.db", [(1, "Primary One"), (2, "Primary Two")])
+    replica = sqlite_file(tmp_path / "replica.db", [(1, "Replica One")])
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": primary,
+        "DATABASE_REPLICA_URL": replica,
+        "REPLICA_READ_YOUR_WRITES_SECONDS": 60,
+        "TESTING": True,
+    })
+    yield app
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+def login(app, username):
+    client = app.test_client()
+    client.post("/login", data={"username": username, "password": f"{username}123"})
+    return client
+
+
+def player_names(client):
+    return [player["name"] for player in client.get("/players?format=json").get_json()["players"]]
+
+
+def test_read_only_endpoints_use_the_replica(routed_app):
+    assert player_names(login(routed_app, "admin")) == ["Replica One"]
+    assert player_names(login(routed_app, "viewer")) == ["Replica One"]
+
+
+def test_writes_and_read_your_writes_use_the_primary(routed_app):
+    client = login(routed_app, "admin")
+    response = client.post("/players/new", data={
+        "player_id": "P3", "name": "Primary Three", "date_of_birth": "2001-01-01",
+    })
+    assert response.status_code == 302
+
+    with routed_app.app_context():
+        assert db.session.execute(text("SELECT COUNT(*) FROM Player")).scalar() == 3
+        replica = db.engines["replica"]
+        with replica.connect() as connection:
+            assert connection.execute(text("SELECT COUNT(*) FROM Player")).scalar() == 1
+
+    # Fenêtre de lecture de ses écritures : le primaire, avec le nouveau joueur
+    assert "Primary Three" in player_names(client)
+    # Les autres sessions restent sur le réplica
+    assert player_names(login(routed_app, "viewer")) == ["Replica One"]
+
+    # Fenêtre écoulée : retour au réplica
+    with client.session_transaction() as session:
+        session["last_write_at"] = 0
+    assert player_names(client) == ["Replica One"]
+
+
+def test_cache_fills_read_the_primary(routed_app):
+    viewer = login(routed_app, "viewer")
+    assert viewer.get("/api/dashboard").get_json()["total_players"] == 2
+    assert viewer.get("/players?format=json").get_json()["players"][0]["name"] == "Replica One"
+
+
+def checkouts(engine):
+    return REGISTRY.get_sample_value("bd_db_pool_checkouts_total", {"engine": engine}) or 0
+
+
+def test_pool_metrics_labelled_by_engine(routed_app):
+    before = {engine: checkouts(engine) for engine in ("primary", "replica")}
+    viewer = login(routed_app, "viewer")
+    player_names(viewer)
+    viewer.get("/api/dashboard")
+    assert checkouts("replica") > before["replica"]
+    assert checkouts("primary") > before["primary"]
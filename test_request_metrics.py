@@ -0,0 +1,41 @@
+import json
+import logging
+from types import SimpleNamespace
+
+from flask import g
+
+from app import _after_cursor_execute, _start_request_metrics
+
+
+class FakeConnection:
+    def __init__(self):
+        self.info = {"query_started": []}
+
+    def execute(self, cursor):
+        self.info["query_started"].append(0.0)
+        _after_cursor_execute(self, cursor, "SELECT 1", (), None, False)
+
+
+def cursor(rowcount, returns_rows):
+    return SimpleNamespace(rowcount=rowcount, description=[("x",)] if returns_rows else None)
+
+
+def test_rows_counted_when_the_driver_reports_them(app):
+    # psycopg2 : rowcount d'un SELECT = lignes retournées
+    with app.test_request_context("/"):
+        _start_request_metrics()
+        connection = FakeConnection()
+        connection.execute(cursor(25, returns_rows=True))
+        connection.execute(cursor(3, returns_rows=False))
+        connection.execute(cursor(-1, returns_rows=False))  # DDL
+        assert (g.sql_statements, g.sql_rows, g.sql_rows_known) == (3, 28, True)
+
+
+def test_sqlite_select_rows_reported_as_unknown(client, add_player, caplog):
+    add_player(1)
+    with caplog.at_level(logging.INFO, logger="bd.requests"):
+        response = client.get("/players?format=json")
+
+    assert "? rows" in response.headers["Server-Timing"]
+    logged = json.loads(caplog.records[-1].getMessage())
+    assert logged["sql_rows"] is None
@@ -0,0 +1,68 @@
+import re
+
+from sqlalchemy import text
+
+from app import db
+from dialect import SCHEMA_FILES, VERSIONED_TABLES
+
+# Objets propres à PostgreSQL : vues matérialisées (simples vues sous SQLite), leur
+# journal de rafraîchissement et l'index trigramme (pg_trgm)
+POSTGRESQL_ONLY = {
+    "table": {"matview_refresh_log"},
+    "index": {
+        "idx_mv_club_height_clu", "idx_mv_club_standings_key", "idx_mv_season_leaderboard_key",
+        "idx_mv_season_leaderboard_points", "idx_mv_team_sponsors_key", "idx_mv_top_scorers_pla",
+        "idx_player_name_trgm",
+    },
+}
+# SQLite : pas de SERIAL hors clé primaire, ID_Stat est renseigné par un trigger
+SQLITE_ONLY_TRIGGERS = {"trg_pgs_id_stat"}
+
+
+def postgresql_schema():
+    with open(SCHEMA_FILES["postgresql"], "r", encoding="utf-8-sig") as f:
+        script = f.read()
+    script = re.sub(r"/\*.*?\*/", "", re.sub(r"--[^\n]*", "", script), flags=re.S)
+
+    def names(pattern):
+        return {name.lower() for name in re.findall(pattern, script, flags=re.I)}
+
+    versioned = re.search(r"FOREACH v_table IN ARRAY ARRAY\[(.*?)\]", script, flags=re.S).group(1)
+    return {
+        "table": names(r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)"),
+        "index": names(r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)"),
+        "view": names(r"CREATE\s+(?:MATERIALIZED\s+)?VIEW\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)"),
+        "trigger": names(r"CREATE\s+TRIGGER\s+(\w+)"),
+        "versioned": re.findall(r"'(\w+)'", versioned),
+    }
+
+
+def sqlite_schema():
+    rows = db.session.execute(text(
+        "SELECT type, lower(name) FROM sqlite_master WHERE name NOT LIKE 'sqlite_%'"
+    )).all()
+    return {kind: {name for row_kind, name in rows if row_kind == kind} for kind in ("table", "index", "view", "trigger")}
+
+
+def test_same_tables_indexes_and_views(app):
+    postgresql, sqlite = postgresql_schema(), sqlite_schema()
+    for kind in ("table", "index", "view"):
+        assert postgresql[kind] - POSTGRESQL_ONLY.get(kind, set()) == sqlite[kind], kind
+
+
+def test_versioned_tables_match_postgresql(app):
+    postgresql, sqlite = postgresql_schema(), sqlite_schema()
+    assert postgresql["versioned"] == list(VERSIONED_TABLES)
+    for table in VERSIONED_TABLES:
+        for event in ("insert", "update", "delete"):
+            assert f"trg_{table}_data_version_{event}" in sqlite["trigger"]
+    assert {row[0] for row in db.session.execute(text("SELECT Table_name FROM Data_Version"))} == set(VERSIONED_TABLES)
+
+
+def test_same_maintenance_triggers(app):
+    # Un trigger PostgreSQL (par instruction) peut correspondre à un trigger SQLite
+    # par événement : TRG_PGS_Career_Stats -> TRG_PGS_Career_Stats_Insert / _Update / _Delete
+    postgresql = postgresql_schema()["trigger"]
+    sqlite = {name for name in sqlite_schema()["trigger"] if "_data_version_" not in name} - SQLITE_ONLY_TRIGGERS
+    assert all(any(name.startswith(trigger) for name in sqlite) for trigger in postgresql)
+    assert all(any(name.startswith(trigger) for trigger in postgresql) for name in sqlite)
@@ -1,4 +1,4 @@
-from app import app, db
+from app import create_app, db
 from sqlalchemy import text
 
 def test_view(view_name):
@@ -17,7 +17,7 @@ def test_view(view_name):
     except Exception as e:
         print(f"Error querying view: {e}")
 
-with app.app_context():
+with create_app().app_context():
     # Execute View Definitions first
     views = ["view1", "view2", "view3"]
     for v in views: